@@ -21,20 +21,19 @@ from aiohttp import web
 from discord import app_commands
 from dotenv import load_dotenv
 
-from sales_fetcher import SalesFetcher, SaleEvent
+from sales_fetcher import SalesFetcher, SaleEvent, _ssl_context
 
 # Load environment variables
 load_dotenv()
 
 # Patch aiohttp.TCPConnector to use certifi by default
+# (the context shared with sales_fetcher, so reconnects don't re-read and re-parse the CA bundle)
 _original_tcp_connector_init = aiohttp.TCPConnector.__init__
 
 def _new_tcp_connector_init(self, *args, **kwargs):
     # If ssl is True or not specified, use certifi
-    if 'ssl' not in kwargs:
-        kwargs['ssl'] = ssl.create_default_context(cafile=certifi.where())
-    elif kwargs.get('ssl') is True:
-        kwargs['ssl'] = ssl.create_default_context(cafile=certifi.where())
+    if 'ssl' not in kwargs or kwargs.get('ssl') is True:
+        kwargs['ssl'] = _ssl_context()
     return _original_tcp_connector_init(self, *args, **kwargs)
 
 aiohttp.TCPConnector.__init__ = _new_tcp_connector_init
@@ -747,8 +746,10 @@ async def on_ready():
     
     logger.info(f"Bot logged in as {client.user}")
     
-    # Initialize sales fetcher
-    sales_fetcher = SalesFetcher(ALCHEMY_API_KEY, NFT_CONTRACT_ADDRESS)
+    # Initialize sales fetcher (on_ready fires again after reconnects - keep the existing one
+    # and its caches rather than leaking a second session)
+    if sales_fetcher is None:
+        sales_fetcher = SalesFetcher(ALCHEMY_API_KEY, NFT_CONTRACT_ADDRESS)
     
     # Get Discord channel - try multiple methods
     try:
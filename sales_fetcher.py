@@ -3,42 +3,505 @@ Alchemy API integration module for fetching NFT sales data.
 Includes IPFS direct image fetching for improved reliability.
 """
 import asyncio
+import functools
+import heapq
+import importlib.util
+import io
 import logging
+import operator
 import os
+import random
+import re
 import ssl
-from collections import OrderedDict
-from dataclasses import dataclass
+import sys
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import aiohttp
 import certifi
 
+# Fast JSON (orjson) with stdlib fallback
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+
+    def _json_loads(data: bytes) -> Any:
+        # orjson rejects a leading UTF-8 BOM (which some IPFS gateways send); json.loads accepts it
+        if data.startswith(b"\xef\xbb\xbf"):
+            data = data[3:]
+        return orjson.loads(data)
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 logger = logging.getLogger(__name__)
 
 # WETH contract address on Ethereum mainnet
 # WETH contract address on Ethereum mainnet (can be overridden via WETH_CONTRACT_ADDRESS env var)
 # Correct address: 0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2 (note: three 'a's after C02)
-WETH_CONTRACT = os.environ.get("WETH_CONTRACT_ADDRESS", "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2").lower()
+WETH_CONTRACT = sys.intern(os.environ.get("WETH_CONTRACT_ADDRESS", "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2").lower())
 ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
 
+# ERC-20 Transfer event signature: Transfer(address indexed from, address indexed to, uint256 value)
+# Event signature hash: keccak256("Transfer(address,address,uint256)") - JSON-RPC returns topics lowercase
+TRANSFER_EVENT_TOPIC = sys.intern("0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef")
+
+# Video URL detection (file extension at end of path, or "video" anywhere in the URL)
+_VIDEO_RE = re.compile(r"\.(?:mp4|webm|mov|avi|mkv)(?:[?#]|$)|video", re.IGNORECASE)
+# Video file extension anywhere in a URL, for checks where "video" elsewhere in the URL shouldn't count
+_VIDEO_EXT_RE = re.compile(r"\.(?:mp4|webm|mov|avi|mkv)", re.IGNORECASE)
+# Leading bytes of MP4 ("ftyp" box) and WebM/Matroska (EBML header) files
+_VIDEO_MAGIC_BYTES = (b'\x00\x00\x00\x18ftyp', b'\x1a\x45\xdf\xa3')
+
+# IPFS CID (CIDv0 "Qm..." or CIDv1 "baf...") as a bare hash, ipfs:// URI, or gateway /ipfs/ path
+_IPFS_HASH_RE = re.compile(
+    r"(?:^ipfs://(?:ipfs/)?|ipfs/|^/?)(Qm[1-9A-HJ-NP-Za-km-z]{44}|baf[a-zA-Z0-9]{20,})(?![a-zA-Z0-9])"
+)
+# IPFS URI without a gateway ("ipfs://CID/path", "ipfs://ipfs/CID", "ipfs/CID"); group 1 is the CID and path
+_IPFS_URI_RE = re.compile(r"^(?:ipfs://(?:ipfs/)?|ipfs/)(.+)", re.DOTALL)
+# IPFS video URL like .../ipfs/HASH/TOKEN_ID.mp4 -> (HASH, TOKEN_ID)
+_IPFS_VIDEO_URL_RE = re.compile(r"/ipfs/([^/?#]+)/(\d+)\.(?:mp4|webm|mov|avi)(?:[?#]|$)", re.IGNORECASE)
+
+# Alchemy's CDN - preferred host for embed images (Cloudinary png/thumbnail URLs often return 400)
+ALCHEMY_CDN_HOST = "nft-cdn.alchemy.com"
+
+# Image URL candidates in an NFT API result, in priority order: (path into the result, key).
+# A key of None means the value at path is itself the URL. Video URLs are skipped, the first
+# Alchemy CDN URL wins, otherwise the first usable URL is used.
+IMAGE_URL_CANDIDATES = (
+    (("image",), "cachedUrl"),
+    (("image",), "originalUrl"),
+    (("image",), "thumbnailUrl"),  # Thumbnails are smaller/more reliable than full PNG conversions
+    (("image",), "pngUrl"),
+    (("media", 0, "gateway"), "cachedUrl"),
+    (("media", 0, "gateway"), "originalUrl"),
+    (("media", 0, "gateway"), None),
+    (("media", 0, "raw"), "cachedUrl"),
+    (("media", 0, "raw"), "pngUrl"),
+    (("media", 0, "raw"), "thumbnailUrl"),
+    (("media", 0, "raw"), "originalUrl"),
+    (("media", 0, "raw"), None),
+    (("metadata", "image"), "cachedUrl"),
+    (("metadata", "image"), "pngUrl"),
+    (("metadata", "image"), "thumbnailUrl"),
+    (("metadata", "image"), "originalUrl"),
+    (("metadata", "image"), None),
+)
+# Cloudinary URLs used only when no other candidate is found
+IMAGE_URL_FALLBACK_CANDIDATES = (
+    (("media", 0, "gateway"), "pngUrl"),
+    (("media", 0, "gateway"), "thumbnailUrl"),
+)
+# Keys that always hold still images, even when the source itself is a video
+STILL_IMAGE_KEYS = frozenset({"pngUrl", "thumbnailUrl"})
+
+# Paths in an NFT API result that may reference IPFS content, walked once per token: (path, is_image).
+# Non-image paths may hold the IPFS URI of the token's metadata JSON; image paths may reference an
+# IPFS image directly (a URL or a dict of URLs).
+IPFS_HASH_SOURCES = (
+    (("tokenUri", "raw"), False),  # Most common
+    (("tokenUri",), False),  # Older responses have tokenUri as a plain string
+    (("metadata", "raw", "originalUrl"), False),
+    (("media", 0, "raw", "originalUrl"), False),
+    (("image", "originalUrl"), False),
+    (("image",), True),
+    (("metadata", "image"), True),
+    (("media", 0, "raw", "originalUrl"), True),
+)
+# Paths in an NFT API result listing image URLs for get_all_image_urls_for_token (a URL or a dict of URLs)
+ALL_IMAGE_URL_SOURCES = (
+    ("media", 0, "gateway"),
+    ("media", 0, "raw"),
+    ("metadata", "image"),
+    ("image",),
+)
+# Keys of an Alchemy image object in download priority order (smallest first)
+IMAGE_URL_PRIORITY_KEYS = ("thumbnailUrl", "pngUrl", "cachedUrl", "originalUrl")
+# Priority for bare URL strings, which rank after every keyed image URL
+RAW_IMAGE_URL_PRIORITY = len(IMAGE_URL_PRIORITY_KEYS)
+# Keys of an Alchemy image object checked for a still-image IPFS hash, before falling back to originalUrl
+IPFS_STILL_IMAGE_KEYS = ("thumbnailUrl", "thumbnail", "pngUrl")
+# Thumbnail/preview fields in IPFS metadata JSON (stills for video NFTs), in priority order
+IPFS_THUMBNAIL_FIELDS = (
+    "thumbnail", "thumbnail_image", "thumbnailImage",
+    "preview", "preview_image", "previewImage",
+    "image_thumbnail", "imageThumbnail",
+    "poster", "poster_image", "posterImage",
+)
+
+# Request headers for JSON-RPC POST bodies (pre-serialized, so aiohttp won't set Content-Type)
+JSON_HEADERS = {"Content-Type": "application/json"}
+# Pre-serialized keep-alive request body
+KEEPALIVE_PAYLOAD = _json_dumps({"jsonrpc": "2.0", "id": 1, "method": "eth_blockNumber", "params": []})
+# Request headers for image downloads (comprehensive, to avoid being blocked)
+IMAGE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Referer': 'https://alchemy.com/',
+}
+# Cloudinary URLs may need an Origin header as well
+CLOUDINARY_IMAGE_HEADERS = {**IMAGE_HEADERS, 'Origin': 'https://alchemy.com/'}
+# Request headers for IPFS gateway metadata fetches
+IPFS_METADATA_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'application/json',
+}
+# Request headers for video downloads (frame extraction)
+VIDEO_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+}
+
+# Download limits
+MAX_IMAGE_DOWNLOAD_BYTES = 8 * 1024 * 1024  # Larger images are skipped
+IMAGE_SINGLE_READ_BYTES = 1536 * 1024  # Bodies declared at most this big are read in one go
+IMAGE_DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # Chunk size when streaming larger/unknown-size bodies
+IMAGE_DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=20)  # Longer than the gateway timeout for Cloudinary
+MAX_VIDEO_DOWNLOAD_BYTES = 50 * 1024 * 1024  # Larger videos are skipped (frame extraction holds them in memory)
+VIDEO_DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=30)  # Videos can be large
+
 # Cache configuration
-MAX_METADATA_CACHE_SIZE = 1000  # Maximum number of cached metadata entries
+MAX_METADATA_CACHE_SIZE = 4096  # Maximum number of cached metadata entries (covers a whole collection)
+METADATA_CACHE_TTL = 600  # Seconds before cached metadata is refetched (picks up reveals/refreshes)
+MAX_IPFS_CACHE_SIZE = 1024  # Maximum number of IPFS metadata documents kept in memory
+MAX_TX_CACHE_SIZE = 500  # Maximum number of cached transactions/receipts (each)
+MAX_PRICE_CACHE_SIZE = 10000  # Maximum number of cached sale prices (small tuples, so kept longer)
+MAX_WETH_TRANSFERS_CACHE_SIZE = 512  # Maximum number of cached WETH transfer lists (one per sale block)
+WETH_TRANSFERS_CACHE_TTL = 60  # Seconds a block's nearby WETH transfers are reused (recent ranges may still grow)
+# Blocks either side of a sale searched for its WETH payment
+WETH_TRANSFER_BLOCK_RANGE = 20
+MAX_IMAGE_CACHE_SIZE = 128  # Maximum number of downloaded images kept for ETag revalidation
+MAX_IMAGE_CACHE_BYTES = 64 * 1024 * 1024  # Total bytes of downloaded images kept in memory
+MAX_IPFS_HASH_CACHE_SIZE = 4096  # Memoized URL -> IPFS hash extractions (same URLs recur across sources)
+
+# Connection pool configuration (caps concurrency so bursts queue instead of triggering 429s)
+MAX_CONNECTIONS = 64  # Total open connections across all hosts
+MAX_CONNECTIONS_PER_HOST = 32  # Open connections per host (Alchemy, IPFS gateways)
+MAX_CONCURRENT_API_CALLS = 32  # In-flight Alchemy RPC/NFT API requests
+MAX_CONCURRENT_METADATA_FETCHES = 10  # In-flight getNFTMetadata calls when falling back from a batch
+MAX_CONCURRENT_PRICE_CHECKS = 16  # Transfers priced at once (each makes several RPC calls in sequence)
+NFT_METADATA_BATCH_SIZE = 100  # Maximum tokens per getNFTMetadataBatch request
+RPC_BATCH_SIZE = 100  # Maximum calls per JSON-RPC batch request
+DNS_CACHE_TTL = 300  # Seconds to cache DNS lookups
+KEEPALIVE_TIMEOUT = 60  # Seconds an idle pooled connection is kept open
+KEEPALIVE_INTERVAL = 25  # Seconds between pings that keep the Alchemy connection warm
+KEEPALIVE_IDLE_TIMEOUT = 30 * 60  # Stop pinging after this many seconds without a real request
+REQUEST_TIMEOUT = 30  # Default total timeout (seconds) for a single HTTP request
+CONNECT_TIMEOUT = 5  # Default seconds to get a connection (pool wait + TCP/TLS connect)
+SOCK_READ_TIMEOUT = 20  # Default seconds allowed between reads from the socket
+
+# IPFS gateways raced for metadata JSON (first successful response wins); the
+# best-performing one is also used when building IPFS image URLs
+IPFS_GATEWAYS = (
+    "https://cloudflare-ipfs.com/ipfs/",
+    "https://ipfs.io/ipfs/",
+    "https://dweb.link/ipfs/",
+    "https://gateway.pinata.cloud/ipfs/",
+    "https://nftstorage.link/ipfs/",
+)
+IPFS_GATEWAY_TIMEOUT = 2  # Seconds to wait for any gateway to answer
+IPFS_GATEWAY_HEDGE_DELAY = 0.25  # Seconds between starting each gateway, fastest-known first
+IPFS_GATEWAY_STATS_WINDOW = 20  # Recent requests per gateway used to rank them
+MAX_IPFS_METADATA_BYTES = 256 * 1024  # Larger "metadata" is almost certainly the media file itself
+_NOT_IPFS_METADATA = object()  # A gateway served the CID, but it isn't metadata JSON - no point asking the others
+IPFS_IMAGE_HEDGE_DELAY = 1.0  # Seconds between starting each gateway for an IPFS image download
+IPFS_IMAGE_RACE_TIMEOUT = 20  # Seconds for a whole IPFS image race, across all gateways
+# Image URL served by one of IPFS_GATEWAYS; group 1 is the CID and path
+_IPFS_GATEWAY_URL_RE = re.compile("^(?:" + "|".join(map(re.escape, IPFS_GATEWAYS)) + ")(.+)", re.DOTALL)
+
+# Retry backoff configuration
+MAX_RETRY_WAIT = 30  # Upper bound (seconds) for a single retry delay
+RETRYABLE_STATUSES = frozenset({429, 500})  # Rate limited / transient server error
+
+
+@functools.lru_cache(maxsize=1)
+def _ssl_context() -> ssl.SSLContext:
+    """SSL context using certifi's CA bundle, built once per process and reused across sessions."""
+    return ssl.create_default_context(cafile=certifi.where())
+
+
+def _backoff_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """
+    Get the delay before retrying a failed API call.
+    
+    Honors the server's Retry-After header when it is a number of seconds,
+    otherwise uses exponential backoff with jitter so concurrent callers
+    don't all retry on the same second.
+    
+    Args:
+        attempt: Zero-based attempt number that just failed
+        retry_after: Value of the Retry-After response header, if any
+        
+    Returns:
+        Seconds to wait before the next attempt
+    """
+    if retry_after:
+        try:
+            return min(MAX_RETRY_WAIT, max(0.0, float(retry_after)))
+        except ValueError:
+            pass  # HTTP-date form - fall back to jittered backoff
+    return min(MAX_RETRY_WAIT, random.uniform(1, 3 * 2 ** attempt))
+
+
+def _resolve_path(data, path: Tuple):
+    """
+    Walk a path of dict keys / list indexes into nested API data.
+    
+    Args:
+        data: Parsed JSON data
+        path: Keys and indexes to follow
+        
+    Returns:
+        Value at path, or None if any step is missing
+    """
+    for step in path:
+        if isinstance(data, dict):
+            data = data.get(step)
+        elif isinstance(data, list) and isinstance(step, int) and step < len(data):
+            data = data[step]
+        else:
+            return None
+    return data
+
+
+def _hex_int(value: Any, default: int = 0) -> int:
+    """
+    Parse a 0x-prefixed hex quantity from API data.
+    
+    Args:
+        value: Hex string such as "0x1a2b"
+        default: Value to return when missing or malformed
+        
+    Returns:
+        Parsed integer, or default
+    """
+    if not isinstance(value, str) or not value.startswith("0x") or value == "0x0":
+        return default
+    try:
+        return int(value, 16)
+    except ValueError:
+        return default
+
+
+def _weth_transfer_wei(transfer: dict) -> int:
+    """
+    Get the amount of an alchemy_getAssetTransfers WETH transfer in wei.
+    
+    The top-level "value" is a decimal token amount (e.g. 1.5), not hex wei, so
+    the exact rawContract.value is preferred.
+    
+    Args:
+        transfer: Transfer from alchemy_getAssetTransfers
+        
+    Returns:
+        Amount in wei, or 0 if missing or unparseable
+    """
+    raw_value = _hex_int((transfer.get("rawContract") or {}).get("value"))
+    if raw_value:
+        return raw_value
+    value = transfer.get("value")
+    if isinstance(value, str) and value.startswith("0x"):
+        return _hex_int(value)
+    try:
+        return int(Decimal(str(value)) * 10**18) if value else 0
+    except ArithmeticError:
+        return 0
+
+
+def _usable_str(value: Any) -> bool:
+    """Check for a non-empty, non-whitespace string (without allocating a stripped copy)."""
+    return isinstance(value, str) and bool(value) and not value.isspace()
+
+
+@functools.lru_cache(maxsize=MAX_IPFS_HASH_CACHE_SIZE)
+def _extract_ipfs_hash(url_or_hash: str) -> Optional[str]:
+    """
+    Extract IPFS hash from various URL formats.
+    
+    Memoized, since the same URLs turn up under several metadata sources.
+    
+    Args:
+        url_or_hash: IPFS URL or hash (e.g., "ipfs://Qm...", "https://ipfs.io/ipfs/Qm...", "Qm...")
+        
+    Returns:
+        IPFS hash (CID) or None
+    """
+    if not url_or_hash:
+        return None
+    
+    # Validate it looks like an IPFS hash (Qm... for CIDv0, baf... for CIDv1)
+    match = _IPFS_HASH_RE.search(url_or_hash)
+    return match.group(1) if match else None
+
+
+def _is_video(container: Optional[dict], url: Optional[str]) -> bool:
+    """
+    Check whether an image source is a video.
+    
+    The source's contentType is authoritative when present; the URLs are only
+    scanned when it's missing.
+    
+    Args:
+        container: Source dict holding contentType/originalUrl, if any
+        url: Candidate URL from the source
+        
+    Returns:
+        True if the source is a video
+    """
+    if container is not None:
+        content_type = container.get("contentType")
+        if content_type and isinstance(content_type, str):
+            return content_type.lower().startswith("video/")
+        # cachedUrl of a video is a video too, so check the original as well
+        original_url = container.get("originalUrl")
+        if isinstance(original_url, str) and _VIDEO_RE.search(original_url):
+            return True
+    return bool(url and _VIDEO_RE.search(url))
+
+
+def _ipfs_gateway_url(url: str, ipfs_gateway: str) -> str:
+    """
+    Rewrite an IPFS URI to a gateway URL, keeping any path within a directory CID.
+    
+    Args:
+        url: Image URL, possibly an IPFS URI
+        ipfs_gateway: Gateway URL prefix (ending in /ipfs/)
+        
+    Returns:
+        Gateway URL, or the URL unchanged if it isn't an IPFS URI
+    """
+    match = _IPFS_URI_RE.match(url)
+    return f"{ipfs_gateway}{match.group(1)}" if match else url
+
+
+def _normalize_image_url(image_url: str, ipfs_gateway: str = IPFS_GATEWAYS[0]) -> Optional[str]:
+    """
+    Turn a selected image URL into one Discord can embed.
+    
+    Converts IPFS URIs to a gateway URL, drops query params and validates the scheme.
+    
+    Args:
+        image_url: URL picked by _select_image_url
+        ipfs_gateway: Gateway URL prefix (ending in /ipfs/) for IPFS URIs
+        
+    Returns:
+        Embeddable URL, or None if the URL is invalid
+    """
+    # Convert IPFS URLs (with or without the ipfs:// protocol) to a gateway URL
+    image_url = _ipfs_gateway_url(image_url, ipfs_gateway)
+    
+    # Clean up URL (remove query params that might cause issues)
+    image_url = image_url.partition("?")[0]
+    
+    # Validate URL
+    if not image_url.startswith(("http://", "https://")):
+        logger.warning(f"Invalid image URL format: {image_url[:50]}")
+        return None
+    
+    # Discord has issues with very long URLs, truncate if needed
+    if len(image_url) > 2000:
+        logger.warning(f"Image URL too long ({len(image_url)} chars), truncating")
+        image_url = image_url[:2000]
+    
+    return image_url
+
+
+def _select_image_url(result: dict) -> Optional[str]:
+    """
+    Pick the best still-image URL from an NFT API metadata result.
+    
+    Args:
+        result: NFT metadata from getNFTMetadata
+        
+    Returns:
+        Image URL, or None if no usable URL was found
+    """
+    first_url = None
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    for path, key in IMAGE_URL_CANDIDATES:
+        source = _resolve_path(result, path)
+        if key is None:
+            url, container = source, None
+        elif isinstance(source, dict):
+            url, container = source.get(key), source
+        else:
+            continue
+        
+        if not _usable_str(url):
+            continue
+        if key not in STILL_IMAGE_KEYS and _is_video(container, url):
+            if debug_enabled:
+                logger.debug("⚠️ Skipping video URL from %s.%s: %.80s", path, key, url)
+            continue
+        
+        if ALCHEMY_CDN_HOST in url:
+            if debug_enabled:
+                logger.debug("✅ SELECTED: %s from %s (Alchemy CDN): %.80s", key, path, url)
+            return url.strip()
+        if first_url is None:
+            first_url = url.strip()
+    
+    if first_url:
+        return first_url
+    
+    for path, key in IMAGE_URL_FALLBACK_CANDIDATES:
+        url = _resolve_path(result, path + (key,))
+        if _usable_str(url):
+            url = url.strip()
+            logger.warning(f"⚠️  FINAL FALLBACK: Using Cloudinary URL (may return 400): {url[:60]}...")
+            return url
+    
+    return None
+
+
+def _extract_first_frame(video_data: bytes) -> bytes:
+    """
+    Decode the first frame of a video and encode it as PNG.
+    
+    Blocking (runs ffmpeg), so call it via asyncio.to_thread.
+    
+    Args:
+        video_data: Raw video bytes
+        
+    Returns:
+        PNG image bytes
+    """
+    import imageio
+    
+    reader = imageio.get_reader(io.BytesIO(video_data), format='ffmpeg')
+    try:
+        frame = reader.get_data(0)  # Get first frame
+    finally:
+        reader.close()
+    
+    buf = io.BytesIO()
+    imageio.imwrite(buf, frame, format='PNG')
+    return buf.getvalue()
 
 
-@dataclass
+@dataclass(slots=True)
 class SaleEvent:
     """Represents an NFT sale event."""
     tx_hash: str
     buyer: str
     seller: str
     token_id: Optional[str]
-    token_ids: Optional[List[str]]
+    token_ids: Optional[Sequence[str]]  # Read-only; a tuple for single-token sales
     token_count: int
     total_price: int  # Price in wei
     timestamp: Optional[datetime]
     is_weth: bool
+    # Position on chain, set by fetch_last_n_sales for ordering (slots, so declared up front)
+    _block_number: int = field(default=0, init=False, repr=False, compare=False)
+    _tx_index: int = field(default=0, init=False, repr=False, compare=False)
+    _sort_key: Tuple[int, int] = field(default=(0, 0), init=False, repr=False, compare=False)
 
 
 class SalesFetcher:
@@ -57,22 +520,122 @@ class SalesFetcher:
         self.rpc_url = f"https://eth-mainnet.g.alchemy.com/v2/{api_key}"
         self.nft_api_url = f"https://eth-mainnet.g.alchemy.com/nft/v3/{api_key}"
         self.session: Optional[aiohttp.ClientSession] = None
-        self._metadata_cache: OrderedDict[str, dict] = OrderedDict()  # LRU cache for metadata
+        self._metadata_cache: OrderedDict[str, Tuple[float, dict]] = OrderedDict()  # LRU cache for metadata (expiry, data)
+        self._inflight_metadata: Dict[str, asyncio.Future] = {}  # Coalesces concurrent misses per token
+        self._api_semaphore = asyncio.Semaphore(MAX_CONCURRENT_API_CALLS)  # Bounds in-flight Alchemy calls
+        self._keepalive_task: Optional[asyncio.Task] = None
+        self._last_used = time.monotonic()  # When a real request last asked for the session
+        self._tx_cache: OrderedDict[str, dict] = OrderedDict()  # LRU cache for confirmed transactions
+        self._receipt_cache: OrderedDict[str, dict] = OrderedDict()  # LRU cache for confirmed receipts
+        self._inflight_tx_calls: Dict[Tuple[str, str], asyncio.Future] = {}  # Coalesces concurrent misses
+        self._price_cache: OrderedDict[Tuple[str, str, str], Tuple[int, bool]] = OrderedDict()  # LRU cache for detected prices
+        self._inflight_prices: Dict[Tuple[str, str, str], asyncio.Future] = {}  # Coalesces concurrent price lookups
+        self._weth_transfers_cache: OrderedDict[int, Tuple[float, List[dict]]] = OrderedDict()  # LRU cache per sale block (expiry, transfers)
+        self._inflight_weth_transfers: Dict[int, asyncio.Future] = {}  # Coalesces concurrent lookups per block
+        self._ipfs_metadata_cache: OrderedDict[str, dict] = OrderedDict()  # LRU cache for IPFS metadata JSON
+        self._image_cache: OrderedDict[str, Tuple[str, bytes]] = OrderedDict()  # LRU cache for images (etag, data)
+        self._image_cache_bytes = 0  # Total size of cached image data
+        self._gateway_stats: Dict[str, deque] = {  # Recent (elapsed_seconds, success) per IPFS gateway
+            gateway: deque(maxlen=IPFS_GATEWAY_STATS_WINDOW) for gateway in IPFS_GATEWAYS
+        }
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session."""
+        """Get or create HTTP session (and restart the keep-alive pings if they went idle)."""
+        self._last_used = time.monotonic()
         if self.session is None or self.session.closed:
-            # Create SSL context with certifi
-            ssl_context = ssl.create_default_context(cafile=certifi.where())
-            connector = aiohttp.TCPConnector(ssl=ssl_context)
-            self.session = aiohttp.ClientSession(connector=connector)
+            connector = aiohttp.TCPConnector(
+                ssl=_ssl_context(),
+                limit=MAX_CONNECTIONS,
+                limit_per_host=MAX_CONNECTIONS_PER_HOST,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                force_close=False,
+                enable_cleanup_closed=True
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(
+                    total=REQUEST_TIMEOUT,
+                    connect=CONNECT_TIMEOUT,
+                    sock_read=SOCK_READ_TIMEOUT
+                )
+            )
+        if self._keepalive_task is None or self._keepalive_task.done():
+            self._keepalive_task = asyncio.create_task(self._keepalive_loop())
         return self.session
     
+    async def _warm_ipfs_gateways(self):
+        """
+        Keep a pooled connection open to every IPFS gateway without counting it as use.
+        
+        Keeps the connector's DNS cache and TLS sessions warm so a burst of
+        IPFS lookups after an idle gap doesn't pay a handshake per gateway.
+        """
+        session = self.session
+        if session is None or session.closed:
+            return
+        
+        async def warm(gateway: str):
+            try:
+                async with session.head(
+                    gateway.split("/ipfs/", 1)[0] + "/",
+                    headers=IPFS_METADATA_HEADERS,
+                    timeout=aiohttp.ClientTimeout(total=IPFS_GATEWAY_TIMEOUT),
+                    allow_redirects=False
+                ):
+                    pass
+            except Exception as e:
+                logger.debug(f"IPFS gateway warm-up failed for {gateway}: {e}")
+        
+        await asyncio.gather(*(warm(gateway) for gateway in IPFS_GATEWAYS))
+    
+    async def _keepalive_loop(self):
+        """
+        Ping Alchemy periodically so the pooled connection stays warm.
+        
+        Sales arrive in bursts with long idle gaps; without this the first
+        call after a gap pays a fresh TCP + TLS handshake. IPFS gateway
+        connections are re-warmed on the same schedule, since they would
+        otherwise expire after KEEPALIVE_TIMEOUT. The pings stop after
+        KEEPALIVE_IDLE_TIMEOUT without a real request (so an abandoned fetcher
+        doesn't ping forever); the next request starts them again.
+        """
+        while True:
+            await asyncio.sleep(KEEPALIVE_INTERVAL)
+            if time.monotonic() - self._last_used > KEEPALIVE_IDLE_TIMEOUT:
+                logger.debug("No Alchemy requests for a while, stopping keep-alive pings")
+                return
+            await asyncio.gather(self._ping(), self._warm_ipfs_gateways())
+    
+    async def _ping(self):
+        """Send an eth_blockNumber request on the pooled connection without counting it as use."""
+        if self.session is None or self.session.closed:
+            return
+        try:
+            async with self.session.post(self.rpc_url, data=KEEPALIVE_PAYLOAD, headers=JSON_HEADERS) as response:
+                await response.read()
+        except Exception as e:
+            logger.debug(f"Keep-alive ping failed: {e}")
+    
     async def close(self):
-        """Close HTTP session."""
+        """Stop the keep-alive pings and close HTTP session."""
+        if self._keepalive_task and not self._keepalive_task.done():
+            self._keepalive_task.cancel()
+            try:
+                await self._keepalive_task
+            except asyncio.CancelledError:
+                pass
+        self._keepalive_task = None
         if self.session and not self.session.closed:
             await self.session.close()
     
+    async def __aenter__(self) -> "SalesFetcher":
+        await self._get_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
     async def _rpc_call(self, method: str, params: List) -> dict:
         """
         Make JSON-RPC call to Alchemy.
@@ -93,57 +656,112 @@ class SalesFetcher:
         }
         
         try:
-            async with session.post(
-                self.rpc_url,
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=30)
-            ) as response:
-                response.raise_for_status()
-                data = await response.json()
-                if "error" in data:
-                    logger.error(f"RPC error: {data['error']}")
-                    return {}
-                return data.get("result", {})
+            async with self._api_semaphore:
+                async with session.post(
+                    self.rpc_url,
+                    data=_json_dumps(payload),
+                    headers=JSON_HEADERS
+                ) as response:
+                    response.raise_for_status()
+                    data = _json_loads(await response.read())
+            if "error" in data:
+                logger.error(f"RPC error: {data['error']}")
+                return {}
+            return data.get("result", {})
         except Exception as e:
             logger.error(f"RPC call failed for {method}: {e}")
             return {}
     
-    async def _nft_api_call(self, endpoint: str, params: dict, max_retries: int = 3) -> dict:
+    async def _rpc_batch_call(self, calls: List[Tuple[str, List]]) -> List[dict]:
+        """
+        Make several JSON-RPC calls to Alchemy in one HTTP request.
+        
+        Args:
+            calls: (method, params) for each call
+            
+        Returns:
+            Response data per call, in the same order ({} for calls that failed)
+        """
+        session = await self._get_session()
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ]
+        results = [{} for _ in calls]
+        
+        try:
+            async with self._api_semaphore:
+                async with session.post(
+                    self.rpc_url,
+                    data=_json_dumps(payload),
+                    headers=JSON_HEADERS
+                ) as response:
+                    response.raise_for_status()
+                    data = _json_loads(await response.read())
+            if not isinstance(data, list):
+                # A single error object means the whole batch was rejected
+                logger.error(f"RPC batch error: {data.get('error') if isinstance(data, dict) else data}")
+                return results
+            # Responses may come back in any order - match them up by id
+            for item in data:
+                i = item.get("id")
+                if not isinstance(i, int) or not 0 <= i < len(results):
+                    continue
+                if "error" in item:
+                    logger.debug("RPC error in batch for %s: %s", calls[i][0], item["error"])
+                else:
+                    results[i] = item.get("result") or {}
+        except Exception as e:
+            logger.error(f"RPC batch call failed for {len(calls)} call(s): {e}")
+        return results
+    
+    async def _nft_api_call(
+        self,
+        endpoint: str,
+        params: Optional[dict],
+        max_retries: int = 3,
+        json_body: Optional[dict] = None
+    ) -> dict:
         """
-        Make call to Alchemy NFT API with retry logic for 500 errors.
+        Make call to Alchemy NFT API with retry logic for 500 errors and rate limits (429).
         
         Args:
             endpoint: API endpoint (e.g., "getNFTMetadata")
             params: Query parameters
-            max_retries: Maximum number of retries for 500 errors
+            max_retries: Maximum number of retries for 500/429 errors
+            json_body: JSON body - sends a POST instead of a GET (e.g., for getNFTMetadataBatch)
             
         Returns:
             Response data
         """
         session = await self._get_session()
         url = f"{self.nft_api_url}/{endpoint}"
+        if json_body is None:
+            method, data, headers = "GET", None, None
+        else:
+            method, data, headers = "POST", _json_dumps(json_body), JSON_HEADERS
         
         for attempt in range(max_retries):
             try:
-                async with session.get(
-                    url,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    # Retry on 500 errors (server errors are often transient)
-                    if response.status == 500:
-                        if attempt < max_retries - 1:
-                            wait_time = (attempt + 1) * 2  # 2s, 4s, 6s
-                            logger.warning(f"Alchemy API returned 500 for {endpoint}, retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})")
-                            await asyncio.sleep(wait_time)
-                            continue
-                        else:
-                            logger.error(f"Alchemy API returned 500 for {endpoint} after {max_retries} attempts")
-                            return {}
-                    
-                    # For other errors, raise immediately
-                    response.raise_for_status()
-                    return await response.json()
+                # Hold the semaphore only for the request itself, not during backoff
+                async with self._api_semaphore:
+                    async with session.request(method, url, params=params, data=data, headers=headers) as response:
+                        # Retry on 500 errors (server errors are often transient) and 429 rate limits
+                        if response.status not in RETRYABLE_STATUSES:
+                            # For other errors, raise immediately
+                            response.raise_for_status()
+                            return _json_loads(await response.read())
+                        status = response.status
+                        retry_after = response.headers.get("Retry-After")
+                
+                if attempt < max_retries - 1:
+                    wait_time = _backoff_delay(attempt, retry_after)
+                    logger.warning(f"Alchemy API returned {status} for {endpoint}, retrying in {wait_time:.1f}s (attempt {attempt + 1}/{max_retries})")
+                    await asyncio.sleep(wait_time)
+                    continue
+                else:
+                    logger.error(f"Alchemy API returned {status} for {endpoint} after {max_retries} attempts")
+                    return {}
             except aiohttp.client_exceptions.ClientResponseError as e:
                 # Don't retry on client errors (4xx)
                 if 400 <= e.status < 500:
@@ -151,8 +769,8 @@ class SalesFetcher:
                     return {}
                 # Retry on server errors (5xx) if we haven't exhausted retries
                 elif e.status >= 500 and attempt < max_retries - 1:
-                    wait_time = (attempt + 1) * 2
-                    logger.warning(f"Alchemy API returned {e.status} for {endpoint}, retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})")
+                    wait_time = _backoff_delay(attempt, e.headers.get("Retry-After") if e.headers else None)
+                    logger.warning(f"Alchemy API returned {e.status} for {endpoint}, retrying in {wait_time:.1f}s (attempt {attempt + 1}/{max_retries})")
                     await asyncio.sleep(wait_time)
                     continue
                 else:
@@ -164,9 +782,92 @@ class SalesFetcher:
         
         return {}
     
+    async def _cached_tx_call(self, cache: OrderedDict, method: str, tx_hash: str) -> dict:
+        """
+        Make a per-transaction RPC call through an LRU cache.
+        
+        Only mined results (with a blockNumber) are cached since those no longer
+        change. Concurrent misses for the same call share a single request.
+        
+        Args:
+            cache: LRU cache to read from and store into
+            method: RPC method name
+            tx_hash: Transaction hash
+            
+        Returns:
+            Response data
+        """
+        key = tx_hash.lower()
+        if key in cache:
+            # Move to end (most recently used)
+            cache.move_to_end(key)
+            return cache[key]
+        
+        inflight_key = (method, key)
+        pending = self._inflight_tx_calls.get(inflight_key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._rpc_call(method, [tx_hash]))
+            self._inflight_tx_calls[inflight_key] = pending
+            pending.add_done_callback(lambda _: self._inflight_tx_calls.pop(inflight_key, None))
+        result = await asyncio.shield(pending)
+        
+        # Cache the result with LRU eviction
+        if result and result.get("blockNumber"):
+            cache[key] = result
+            # Evict oldest entries if over limit
+            while len(cache) > MAX_TX_CACHE_SIZE:
+                cache.popitem(last=False)
+        
+        return result
+    
+    async def _prefetch_tx_calls(self, cache: OrderedDict, method: str, tx_hashes: List[str]):
+        """
+        Load per-transaction RPC results into an LRU cache with batched requests.
+        
+        Args:
+            cache: LRU cache to store into (as used by _cached_tx_call)
+            method: RPC method name
+            tx_hashes: Transaction hashes (cached or in-flight ones are skipped)
+        """
+        missing = list({
+            tx_hash.lower(): tx_hash for tx_hash in tx_hashes
+            if tx_hash.lower() not in cache
+            and (method, tx_hash.lower()) not in self._inflight_tx_calls
+        }.values())
+        for i in range(0, len(missing), RPC_BATCH_SIZE):
+            batch = missing[i:i + RPC_BATCH_SIZE]
+            results = await self._rpc_batch_call([(method, [tx_hash]) for tx_hash in batch])
+            for tx_hash, result in zip(batch, results):
+                # Same rule as _cached_tx_call - only mined results are cached
+                if result and result.get("blockNumber"):
+                    cache[tx_hash.lower()] = result
+            while len(cache) > MAX_TX_CACHE_SIZE:
+                cache.popitem(last=False)
+    
+    async def prefetch_transactions(self, tx_hashes: List[str]):
+        """
+        Load transactions, and the receipts price detection will need, into the cache.
+        
+        Lets a burst of price checks read from the cache instead of making their
+        own eth_getTransactionByHash / eth_getTransactionReceipt round trips.
+        Receipts are only fetched for zero-value transactions (possible WETH sales).
+        
+        Args:
+            tx_hashes: Transaction hashes
+        """
+        await self._prefetch_tx_calls(self._tx_cache, "eth_getTransactionByHash", tx_hashes)
+        zero_value = []
+        for tx_hash in tx_hashes:
+            tx = self._tx_cache.get(tx_hash.lower())
+            if tx and tx.get("value", "0x0") == "0x0":
+                zero_value.append(tx_hash)
+        if zero_value:
+            await self._prefetch_tx_calls(self._receipt_cache, "eth_getTransactionReceipt", zero_value)
+    
     async def get_transaction(self, tx_hash: str) -> dict:
         """
         Get transaction details by hash.
+        Uses LRU caching to avoid duplicate API calls.
         
         Args:
             tx_hash: Transaction hash
@@ -174,11 +875,12 @@ class SalesFetcher:
         Returns:
             Transaction data
         """
-        return await self._rpc_call("eth_getTransactionByHash", [tx_hash])
+        return await self._cached_tx_call(self._tx_cache, "eth_getTransactionByHash", tx_hash)
     
     async def get_transaction_receipt(self, tx_hash: str) -> dict:
         """
         Get transaction receipt by hash (includes logs).
+        Uses LRU caching to avoid duplicate API calls.
         
         Args:
             tx_hash: Transaction hash
@@ -186,7 +888,7 @@ class SalesFetcher:
         Returns:
             Transaction receipt with logs
         """
-        return await self._rpc_call("eth_getTransactionReceipt", [tx_hash])
+        return await self._cached_tx_call(self._receipt_cache, "eth_getTransactionReceipt", tx_hash)
     
     async def get_asset_transfers(
         self,
@@ -196,7 +898,9 @@ class SalesFetcher:
         category: List[str] = None,
         from_block: Optional[str] = None,
         to_block: Optional[str] = None,
-        page_key: Optional[str] = None
+        page_key: Optional[str] = None,
+        order: Optional[str] = None,
+        max_count: Optional[int] = None
     ) -> dict:
         """
         Get asset transfers using alchemy_getAssetTransfers.
@@ -209,6 +913,8 @@ class SalesFetcher:
             from_block: Starting block (hex)
             to_block: Ending block (hex)
             page_key: Pagination key
+            order: "asc" (Alchemy's default) or "desc" for most recent first
+            max_count: Maximum transfers to return (Alchemy's default and cap is 1000)
             
         Returns:
             Transfer data
@@ -228,6 +934,10 @@ class SalesFetcher:
             params["toBlock"] = to_block
         if page_key:
             params["pageKey"] = page_key
+        if order:
+            params["order"] = order
+        if max_count:
+            params["maxCount"] = hex(max_count)
         
         return await self._rpc_call("alchemy_getAssetTransfers", [params])
     
@@ -246,29 +956,127 @@ class SalesFetcher:
         if token_id.startswith("0x"):
             token_id = str(int(token_id, 16))
         
-        # Check cache first (move to end for LRU)
+        # Check cache first
         cache_key = f"{self.contract_address}:{token_id}"
-        if cache_key in self._metadata_cache:
-            # Move to end (most recently used)
-            self._metadata_cache.move_to_end(cache_key)
+        metadata = self._get_cached_metadata(cache_key)
+        if metadata is not None:
             logger.debug(f"Using cached metadata for token {token_id}")
-            return self._metadata_cache[cache_key]
+            return metadata
         
-        params = {
-            "contractAddress": self.contract_address,
-            "tokenId": token_id
-        }
-        metadata = await self._nft_api_call("getNFTMetadata", params)
+        # Share one request between concurrent callers for the same token
+        pending = self._inflight_metadata.get(cache_key)
+        if pending is None:
+            params = {
+                "contractAddress": self.contract_address,
+                "tokenId": token_id
+            }
+            pending = asyncio.ensure_future(self._nft_api_call("getNFTMetadata", params))
+            self._inflight_metadata[cache_key] = pending
+            pending.add_done_callback(lambda _: self._inflight_metadata.pop(cache_key, None))
+        metadata = await asyncio.shield(pending)
         
-        # Cache the result with LRU eviction
         if metadata:
-            self._metadata_cache[cache_key] = metadata
-            # Evict oldest entries if over limit
-            while len(self._metadata_cache) > MAX_METADATA_CACHE_SIZE:
-                self._metadata_cache.popitem(last=False)
+            self._cache_metadata(cache_key, metadata)
+        
+        return metadata
+    
+    async def get_nft_metadata_batch(self, token_ids: List[str]) -> List[dict]:
+        """
+        Get NFT metadata for several tokens with getNFTMetadataBatch.
+        Cached tokens are served from the LRU cache; the rest are fetched
+        NFT_METADATA_BATCH_SIZE at a time.
+        
+        Args:
+            token_ids: Token IDs (hex or decimal strings)
+            
+        Returns:
+            NFT metadata per token in input order ({} where unavailable)
+        """
+        # Convert token_ids to decimal if they're hex
+        decimal_ids = [str(int(token_id, 16)) if token_id.startswith("0x") else token_id for token_id in token_ids]
+        
+        found: Dict[str, dict] = {}
+        missing = []
+        for token_id in dict.fromkeys(decimal_ids):
+            metadata = self._get_cached_metadata(f"{self.contract_address}:{token_id}")
+            if metadata is not None:
+                found[token_id] = metadata
+            else:
+                missing.append(token_id)
+        
+        for i in range(0, len(missing), NFT_METADATA_BATCH_SIZE):
+            batch = missing[i:i + NFT_METADATA_BATCH_SIZE]
+            body = {
+                "tokens": [
+                    {"contractAddress": self.contract_address, "tokenId": token_id}
+                    for token_id in batch
+                ]
+            }
+            response = await self._nft_api_call("getNFTMetadataBatch", None, json_body=body)
+            # v3 wraps the list in {"nfts": [...]}; older versions return the list itself
+            nfts = response.get("nfts") if isinstance(response, dict) else response
+            
+            if not nfts:
+                # Batch endpoint failed - fall back to individual (cached, coalesced) lookups
+                logger.warning(f"getNFTMetadataBatch returned nothing for {len(batch)} token(s), fetching individually")
+                semaphore = asyncio.Semaphore(MAX_CONCURRENT_METADATA_FETCHES)
+                
+                async def bounded_fetch(token_id: str) -> dict:
+                    async with semaphore:
+                        return await self.get_nft_metadata(token_id)
+                
+                results = await asyncio.gather(*(bounded_fetch(t) for t in batch), return_exceptions=True)
+                for token_id, result in zip(batch, results):
+                    if isinstance(result, Exception):
+                        logger.warning(f"Error fetching NFT metadata: {result}")
+                    elif result:
+                        found[token_id] = result
+                continue
+            
+            for nft in nfts:
+                token_id = str(nft.get("tokenId") or "")
+                if token_id.startswith("0x"):
+                    token_id = str(int(token_id, 16))
+                if token_id:
+                    found[token_id] = nft
+                    self._cache_metadata(f"{self.contract_address}:{token_id}", nft)
+        
+        return [found.get(token_id, {}) for token_id in decimal_ids]
+    
+    def _get_cached_metadata(self, cache_key: str) -> Optional[dict]:
+        """
+        Look up unexpired metadata in the LRU cache.
         
+        Args:
+            cache_key: "<contract>:<decimal token id>"
+            
+        Returns:
+            Cached metadata, or None on a miss
+        """
+        cached = self._metadata_cache.get(cache_key)
+        if cached is None:
+            return None
+        expires_at, metadata = cached
+        if expires_at <= time.monotonic():
+            del self._metadata_cache[cache_key]
+            return None
+        # Move to end (most recently used)
+        self._metadata_cache.move_to_end(cache_key)
         return metadata
     
+    def _cache_metadata(self, cache_key: str, metadata: dict):
+        """
+        Store metadata in the LRU cache, evicting the oldest entries if over limit.
+        
+        Args:
+            cache_key: "<contract>:<decimal token id>"
+            metadata: NFT metadata to cache
+        """
+        self._metadata_cache[cache_key] = (time.monotonic() + METADATA_CACHE_TTL, metadata)
+        self._metadata_cache.move_to_end(cache_key)
+        while len(self._metadata_cache) > MAX_METADATA_CACHE_SIZE:
+            self._metadata_cache.popitem(last=False)
+    
     async def get_current_block(self) -> int:
         """
         Get current block number.
@@ -286,6 +1094,88 @@ class SalesFetcher:
         tx_hash: str,
         seller_address: Optional[str] = None,
         buyer_address: Optional[str] = None
+    ) -> Tuple[int, bool]:
+        """
+        Get transaction price in wei, through an LRU cache.
+        
+        Only detected (non-zero) prices are cached, since a zero may come from a
+        pending transaction or a failed lookup. Concurrent lookups for the same
+        sale share a single set of RPC calls.
+        
+        Args:
+            tx_hash: Transaction hash
+            seller_address: Seller address (to match WETH transfers to seller)
+            buyer_address: Buyer address (to match WETH transfers from buyer)
+            
+        Returns:
+            Tuple of (price in wei, is_weth: bool)
+        """
+        key = (tx_hash.lower(), (seller_address or "").lower(), (buyer_address or "").lower())
+        if key in self._price_cache:
+            self._price_cache.move_to_end(key)
+            return self._price_cache[key]
+        
+        pending = self._inflight_prices.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._lookup_transaction_price(tx_hash, seller_address, buyer_address))
+            self._inflight_prices[key] = pending
+            pending.add_done_callback(lambda _: self._inflight_prices.pop(key, None))
+        result = await asyncio.shield(pending)
+        
+        if result[0] > 0:
+            self._price_cache[key] = result
+            while len(self._price_cache) > MAX_PRICE_CACHE_SIZE:
+                self._price_cache.popitem(last=False)
+        
+        return result
+    
+    async def _get_weth_transfers_near_block(self, block_num: int) -> List[dict]:
+        """
+        Get WETH transfers within WETH_TRANSFER_BLOCK_RANGE blocks of a sale's block.
+        
+        Several sales in one block (sweeps) need the same range, so results are kept
+        briefly in an LRU cache and concurrent lookups share a single request.
+        
+        Args:
+            block_num: Block number of the sale
+            
+        Returns:
+            WETH transfers from alchemy_getAssetTransfers
+        """
+        cached = self._weth_transfers_cache.get(block_num)
+        if cached is not None:
+            expires_at, transfers_list = cached
+            if expires_at > time.monotonic():
+                self._weth_transfers_cache.move_to_end(block_num)
+                return transfers_list
+            del self._weth_transfers_cache[block_num]
+        
+        pending = self._inflight_weth_transfers.get(block_num)
+        if pending is None:
+            pending = asyncio.ensure_future(self.get_asset_transfers(
+                contract_address=WETH_CONTRACT,
+                category=["erc20"],
+                from_block=hex(max(0, block_num - WETH_TRANSFER_BLOCK_RANGE)),
+                to_block=hex(block_num + WETH_TRANSFER_BLOCK_RANGE)
+            ))
+            self._inflight_weth_transfers[block_num] = pending
+            pending.add_done_callback(lambda _: self._inflight_weth_transfers.pop(block_num, None))
+        transfers = await asyncio.shield(pending)
+        
+        transfers_list = transfers.get("transfers", []) if transfers else []
+        # _rpc_call returns {} on errors - only cache real responses
+        if transfers and "transfers" in transfers:
+            self._weth_transfers_cache[block_num] = (time.monotonic() + WETH_TRANSFERS_CACHE_TTL, transfers_list)
+            while len(self._weth_transfers_cache) > MAX_WETH_TRANSFERS_CACHE_SIZE:
+                self._weth_transfers_cache.popitem(last=False)
+        
+        return transfers_list
+    
+    async def _lookup_transaction_price(
+        self,
+        tx_hash: str,
+        seller_address: Optional[str] = None,
+        buyer_address: Optional[str] = None
     ) -> Tuple[int, bool]:
         """
         Get transaction price in wei.
@@ -342,76 +1232,63 @@ class SalesFetcher:
                 else:
                     logs = receipt.get("logs", [])
                     logger.info(f"🔍 Strategy 0: Found {len(logs)} log(s) in transaction")
-                    weth_contract_lower = WETH_CONTRACT.lower()
-                    # WETH Transfer event signature: Transfer(address indexed from, address indexed to, uint256 value)
-                    # Event signature hash: keccak256("Transfer(address,address,uint256)") = 0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef
-                    transfer_event_topic = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+                    # Only WETH contract logs can carry the payment - filter once up front
+                    weth_logs = [log for log in logs if (log.get("address") or "").lower() == WETH_CONTRACT]
+                    weth_logs_found = len(weth_logs)
                     
                     # Log all unique contract addresses in the logs to help debug
-                    unique_contracts = set()
-                    for log in logs:
-                        log_addr = log.get("address", "").lower()
-                        if log_addr:
-                            unique_contracts.add(log_addr)
-                    logger.info(f"🔍 Strategy 0: Unique contract addresses in logs: {len(unique_contracts)}")
-                    if unique_contracts:
-                        logger.info(f"🔍 Strategy 0: Contract addresses: {', '.join([addr[:10] + '...' for addr in list(unique_contracts)[:5]])}...")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        unique_contracts = {(log.get("address") or "").lower() for log in logs} - {""}
+                        logger.debug(f"🔍 Strategy 0: Unique contract addresses in logs: {len(unique_contracts)}")
+                        if unique_contracts:
+                            logger.debug(f"🔍 Strategy 0: Contract addresses: {', '.join([addr[:10] + '...' for addr in list(unique_contracts)[:5]])}...")
                     
-                    weth_logs_found = 0
-                    all_weth_transfers = []  # Track all WETH transfers for fallback
+                    # Largest WETH transfer seen before any seller match (fallback only)
+                    largest_amount = 0
+                    largest_to = ""
                     
-                    for i, log in enumerate(logs):
-                        log_address = log.get("address", "").lower()
-                        # Check if this is a WETH contract log
-                        if log_address == weth_contract_lower:
-                            weth_logs_found += 1
-                            logger.info(f"🔍 Strategy 0: Found WETH contract log #{weth_logs_found} (log {i+1}/{len(logs)})")
-                            # Check if this is a Transfer event
-                            topics = log.get("topics", [])
-                            if topics and len(topics) >= 3:
-                                event_topic = topics[0].lower()
-                                if event_topic == transfer_event_topic:
-                                    # Extract from, to, and value from log
-                                    from_addr = "0x" + topics[1][-40:] if len(topics[1]) >= 42 else topics[1]
-                                    to_addr = "0x" + topics[2][-40:] if len(topics[2]) >= 42 else topics[2]
-                                    value_hex = log.get("data", "0x0")
-                                    
-                                    try:
-                                        weth_amount = int(value_hex, 16) if value_hex != "0x0" else 0
-                                    except (ValueError, TypeError):
-                                        weth_amount = 0
-                                    
+                    for i, log in enumerate(weth_logs, 1):
+                        logger.info(f"🔍 Strategy 0: Found WETH contract log #{i}/{weth_logs_found} ({len(logs)} log(s) total)")
+                        # Check if this is a Transfer event
+                        topics = log.get("topics", [])
+                        if topics and len(topics) >= 3:
+                            if topics[0] == TRANSFER_EVENT_TOPIC:
+                                # Extract from, to, and value from log
+                                from_addr = "0x" + topics[1][-40:] if len(topics[1]) >= 42 else topics[1]
+                                to_addr = ("0x" + topics[2][-40:] if len(topics[2]) >= 42 else topics[2]).lower()
+                                value_hex = log.get("data", "0x0")
+                                
+                                try:
+                                    weth_amount = int(value_hex, 16) if value_hex != "0x0" else 0
+                                except (ValueError, TypeError):
+                                    weth_amount = 0
+                                
+                                logger.info(f"🔍 Strategy 0: WETH Transfer - from: {from_addr[:10]}..., to: {to_addr[:10]}..., amount: {weth_amount / (10**18):.6f}")
+                                
+                                # Check if this transfer is to the seller
+                                if seller_lower and to_addr == seller_lower:
                                     if weth_amount > 0:
-                                        all_weth_transfers.append({
-                                            "from": from_addr.lower(),
-                                            "to": to_addr.lower(),
-                                            "amount": weth_amount
-                                        })
-                                    
-                                    logger.info(f"🔍 Strategy 0: WETH Transfer - from: {from_addr[:10]}..., to: {to_addr[:10]}..., amount: {weth_amount / (10**18):.6f}")
-                                    
-                                    # Check if this transfer is to the seller
-                                    if seller_lower and to_addr.lower() == seller_lower:
-                                        if weth_amount > 0:
-                                            weth_total += weth_amount
-                                            logger.info(f"✅ Strategy 0: Found WETH in same tx (from logs): {weth_amount / (10**18):.6f} WETH to seller {seller_lower[:10]}...")
-                                    else:
-                                        logger.debug(f"⚠️ Strategy 0: WETH transfer to_addr ({to_addr.lower()[:10]}...) does not match seller ({seller_lower[:10] if seller_lower else 'None'}...)")
+                                        weth_total += weth_amount
+                                        logger.info(f"✅ Strategy 0: Found WETH in same tx (from logs): {weth_amount / (10**18):.6f} WETH to seller {seller_lower[:10]}...")
+                                else:
+                                    # Only track the fallback until a seller match is found
+                                    if weth_total == 0 and weth_amount > largest_amount:
+                                        largest_amount = weth_amount
+                                        largest_to = to_addr
+                                    logger.debug(f"⚠️ Strategy 0: WETH transfer to_addr ({to_addr[:10]}...) does not match seller ({seller_lower[:10] if seller_lower else 'None'}...)")
                     
                     # If no WETH to seller found, use LARGEST WETH transfer as fallback
                     # This handles cases where seller uses different address for payment
-                    if weth_total == 0 and all_weth_transfers:
-                        # Sort by amount descending and use the largest
-                        largest = max(all_weth_transfers, key=lambda x: x["amount"])
-                        weth_total = largest["amount"]
-                        logger.info(f"✅ Strategy 0 FALLBACK: Using largest WETH transfer: {weth_total / (10**18):.6f} WETH to {largest['to'][:10]}...")
+                    if weth_total == 0 and largest_amount > 0:
+                        weth_total = largest_amount
+                        logger.info(f"✅ Strategy 0 FALLBACK: Using largest WETH transfer: {weth_total / (10**18):.6f} WETH to {largest_to[:10]}...")
                     
                     if weth_logs_found == 0:
                         logger.info(f"ℹ️ Strategy 0: No WETH contract logs found in transaction (checked {len(logs)} log(s))")
                     elif weth_total == 0:
                         logger.info(f"ℹ️ Strategy 0: Found {weth_logs_found} WETH contract log(s), but no matching transfers")
             except Exception as e:
-                logger.error(f"❌ Strategy 0: Error checking transaction receipt for WETH: {e}", exc_info=True)
+                logger.error(f"❌ Strategy 0: Error checking transaction receipt for WETH: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
             
             if weth_total > 0:
                 logger.info(f"✅ Found WETH transfer in same transaction: {weth_total / (10**18):.6f} WETH for tx {tx_hash[:16]}...")
@@ -461,11 +1338,10 @@ class SalesFetcher:
                     if buyer_list:
                         for transfer in buyer_list[:5]:  # Log first 5
                             transfer_to = transfer.get("to", "")
-                            transfer_value = transfer.get("value", "0x0")
                             transfer_hash = transfer.get("hash", "")
                             transfer_block = transfer.get("blockNum", "")
                             try:
-                                value_wei = int(transfer_value, 16) if transfer_value != "0x0" else 0
+                                value_wei = _weth_transfer_wei(transfer)
                                 block_diff = ""
                                 if transfer_block:
                                     try:
@@ -483,63 +1359,61 @@ class SalesFetcher:
             
             # Strategy 2: Also check block range around the transaction (in case addresses don't match exactly)
             # Check from block-20 to block+20 to catch WETH transfers
-            from_block = max(0, block_num - 20)
-            to_block = block_num + 20
+            from_block = max(0, block_num - WETH_TRANSFER_BLOCK_RANGE)
+            to_block = block_num + WETH_TRANSFER_BLOCK_RANGE
             
             logger.info(f"🔍 Strategy 2: Checking WETH transfers in blocks {from_block} to {to_block} (range: {to_block - from_block} blocks)")
             
-            # Get ERC-20 transfers for this block range (WETH only)
-            transfers = await self.get_asset_transfers(
-                contract_address=WETH_CONTRACT,
-                category=["erc20"],
-                from_block=hex(from_block),
-                to_block=hex(to_block)
-            )
-            
-            block_range_list = transfers.get("transfers", [])
+            # Get ERC-20 transfers for this block range (WETH only) - shared by sales in the same block
+            block_range_list = await self._get_weth_transfers_near_block(block_num)
             logger.info(f"🔍 Found {len(block_range_list)} WETH transfer(s) in block range {from_block}-{to_block}")
             
             # Add transfers from block range (avoid duplicates)
+            known_hashes = {(t.get("hash") or "").lower() for t in transfers_list}
             for transfer in block_range_list:
-                transfer_hash = transfer.get("hash", "")
+                transfer_hash = (transfer.get("hash") or "").lower()
                 # Only add if not already in transfers_list
-                if not any(t.get("hash", "").lower() == transfer_hash.lower() for t in transfers_list):
+                if transfer_hash not in known_hashes:
+                    known_hashes.add(transfer_hash)
                     transfers_list.append(transfer)
                     logger.debug(f"➕ Added WETH transfer from block range: {transfer_hash[:16]}...")
             
             logger.info(f"🔍 Total WETH transfers to check: {len(transfers_list)}")
             
+            # Lowercase/truncate once for matching and log messages below
+            tx_hash_lower = tx_hash.lower()
+            seller_prefix = seller_lower[:10] if seller_lower else "None"
+            buyer_prefix = buyer_lower[:10] if buyer_lower else "None"
+            
             # Filter transfers - WETH payment goes TO the seller (seller receives payment)
             # Check both: same transaction hash OR matching addresses (WETH might be in different tx)
             for i, transfer in enumerate(transfers_list):
-                logger.debug(f"🔍 WETH transfer {i+1}/{len(transfers_list)}: hash={transfer.get('hash', '')[:16]}..., from={transfer.get('from', '')[:10]}..., to={transfer.get('to', '')[:10]}...")
-                transfer_hash = transfer.get("hash", "")
-                transfer_from = transfer.get("from", "").lower()
-                transfer_to = transfer.get("to", "").lower()
+                transfer_hash = (transfer.get("hash") or "").lower()
+                transfer_from = (transfer.get("from") or "").lower()
+                transfer_to = (transfer.get("to") or "").lower()
                 transfer_block = transfer.get("blockNum", "")
+                logger.debug(f"🔍 WETH transfer {i+1}/{len(transfers_list)}: hash={transfer_hash[:16]}..., from={transfer_from[:10]}..., to={transfer_to[:10]}...")
                 
                 # Get WETH amount
-                value_hex = transfer.get("value", "0x0")
-                if value_hex and value_hex != "0x0":
+                weth_amount = _weth_transfer_wei(transfer)
+                if weth_amount > 0:
                     try:
-                        weth_amount = int(value_hex, 16)
-                        
                         # Match by transaction hash first (most reliable)
-                        if transfer_hash and transfer_hash.lower() == tx_hash.lower():
+                        if transfer_hash and transfer_hash == tx_hash_lower:
                             logger.debug(f"✅ WETH transfer matches tx hash: {transfer_hash[:16]}...")
                             if seller_lower and transfer_to == seller_lower:
                                 weth_total += weth_amount
-                                logger.info(f"✅ Found WETH in same tx: {weth_amount / (10**18):.6f} WETH to seller {seller_lower[:10]}...")
+                                logger.info(f"✅ Found WETH in same tx: {weth_amount / (10**18):.6f} WETH to seller {seller_prefix}...")
                             elif not seller_lower:
                                 # No seller address, just sum all WETH transfers in this tx
                                 weth_total += weth_amount
                                 logger.info(f"✅ Found WETH in same tx (no seller check): {weth_amount / (10**18):.6f} WETH")
                             else:
-                                logger.debug(f"⚠️ WETH in same tx but transfer_to ({transfer_to[:10]}...) != seller ({seller_lower[:10]}...)")
+                                logger.debug(f"⚠️ WETH in same tx but transfer_to ({transfer_to[:10]}...) != seller ({seller_prefix}...)")
                         # Also check if WETH transfer involves the same addresses (might be different tx)
                         # WETH goes from buyer to seller
                         elif seller_lower and buyer_lower:
-                            logger.debug(f"🔍 Checking address match: transfer_from={transfer_from[:10]}... (buyer={buyer_lower[:10]}...), transfer_to={transfer_to[:10]}... (seller={seller_lower[:10]}...)")
+                            logger.debug(f"🔍 Checking address match: transfer_from={transfer_from[:10]}... (buyer={buyer_prefix}...), transfer_to={transfer_to[:10]}... (seller={seller_prefix}...)")
                             if transfer_from == buyer_lower and transfer_to == seller_lower:
                                 # Check if transfer is in a nearby block (within 5 blocks)
                                 if transfer_block:
@@ -549,21 +1423,21 @@ class SalesFetcher:
                                         logger.debug(f"🔍 Transfer block {transfer_block_num}, NFT tx block {block_num}, diff: {block_diff}")
                                         if block_diff <= 5:
                                             weth_total += weth_amount
-                                            logger.info(f"✅ Found WETH in nearby block {transfer_block_num} (diff: {block_diff}): {weth_amount / (10**18):.6f} WETH from buyer {buyer_lower[:10]}... to seller {seller_lower[:10]}...")
+                                            logger.info(f"✅ Found WETH in nearby block {transfer_block_num} (diff: {block_diff}): {weth_amount / (10**18):.6f} WETH from buyer {buyer_prefix}... to seller {seller_prefix}...")
                                         else:
                                             logger.debug(f"⚠️ WETH transfer block {transfer_block_num} too far from NFT tx block {block_num} (diff: {block_diff} > 5)")
                                     except (ValueError, TypeError) as e:
                                         # If block parsing fails, still count it if addresses match
                                         logger.warning(f"⚠️ Could not parse transfer block '{transfer_block}': {e}, but addresses match - counting WETH")
                                         weth_total += weth_amount
-                                        logger.info(f"✅ Found WETH (addresses match, block parse failed): {weth_amount / (10**18):.6f} WETH from buyer {buyer_lower[:10]}... to seller {seller_lower[:10]}...")
+                                        logger.info(f"✅ Found WETH (addresses match, block parse failed): {weth_amount / (10**18):.6f} WETH from buyer {buyer_prefix}... to seller {seller_prefix}...")
                                 else:
                                     # No block info, but addresses match - count it
                                     logger.warning(f"⚠️ No block info for WETH transfer, but addresses match - counting it")
                                     weth_total += weth_amount
-                                    logger.info(f"✅ Found WETH (addresses match, no block info): {weth_amount / (10**18):.6f} WETH from buyer {buyer_lower[:10]}... to seller {seller_lower[:10]}...")
+                                    logger.info(f"✅ Found WETH (addresses match, no block info): {weth_amount / (10**18):.6f} WETH from buyer {buyer_prefix}... to seller {seller_prefix}...")
                             else:
-                                logger.debug(f"⚠️ Address mismatch: transfer_from ({transfer_from[:10]}...) != buyer ({buyer_lower[:10]}...) OR transfer_to ({transfer_to[:10]}...) != seller ({seller_lower[:10]}...)")
+                                logger.debug(f"⚠️ Address mismatch: transfer_from ({transfer_from[:10]}...) != buyer ({buyer_prefix}...) OR transfer_to ({transfer_to[:10]}...) != seller ({seller_prefix}...)")
                         elif seller_lower and transfer_to == seller_lower:
                             # WETH goes to seller (no buyer check) - but only if in nearby block
                             if transfer_block:
@@ -571,7 +1445,7 @@ class SalesFetcher:
                                     transfer_block_num = int(transfer_block, 16) if transfer_block.startswith("0x") else int(transfer_block)
                                     if abs(transfer_block_num - block_num) <= 5:
                                         weth_total += weth_amount
-                                        logger.info(f"✅ Found WETH to seller in block {transfer_block_num}: {weth_amount / (10**18):.6f} WETH to {seller_lower[:10]}...")
+                                        logger.info(f"✅ Found WETH to seller in block {transfer_block_num}: {weth_amount / (10**18):.6f} WETH to {seller_prefix}...")
                                 except (ValueError, TypeError):
                                     pass
                     except (ValueError, TypeError):
@@ -594,7 +1468,7 @@ class SalesFetcher:
     ) -> List[str]:
         """
         Fetch NFT images for given token IDs.
-        Batches requests to avoid rate limits.
+        Fetches all metadata in one getNFTMetadataBatch request.
         
         Args:
             token_ids: List of token IDs
@@ -609,314 +1483,24 @@ class SalesFetcher:
         
         # Limit to max_images
         token_ids = token_ids[:max_images]
-        logger.info(f"Fetching images for {len(token_ids)} token(s): {token_ids[:5]}{'...' if len(token_ids) > 5 else ''}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Fetching images for {len(token_ids)} token(s): {token_ids[:5]}{'...' if len(token_ids) > 5 else ''}")
         image_urls = []
-        batch_size = 5
+        ipfs_gateway = self._best_ipfs_gateway()
         
-        for i in range(0, len(token_ids), batch_size):
-            batch = token_ids[i:i + batch_size]
+        for result in await self.get_nft_metadata_batch(token_ids):
+            if not result:
+                continue
             
-            # Fetch metadata for batch in parallel
-            tasks = [self.get_nft_metadata(token_id) for token_id in batch]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            image_url = _select_image_url(result)
             
-            for result in results:
-                if isinstance(result, Exception):
-                    logger.warning(f"Error fetching NFT metadata: {result}")
-                    continue
-                
-                if not result:
-                    continue
-                
-                # Try different image sources in priority order
-                # We'll collect all URLs and pick the best one (prefer Alchemy CDN over Cloudinary)
-                image_url = None
-                cloudinary_url = None  # Store Cloudinary URL as fallback only
-                
-                # FIRST: Check top-level image (where cachedUrl usually exists)
-                # We check this FIRST because it's the most reliable source
-                top_image = result.get("image")
-                if isinstance(top_image, dict):
-                    cached_url = top_image.get("cachedUrl")
-                    original_url = top_image.get("originalUrl")
-                    png_url = top_image.get("pngUrl")
-                    thumbnail_url = top_image.get("thumbnailUrl")
-                    content_type = top_image.get("contentType", "")
-                    
-                    # Check if originalUrl indicates it's a video (to know if cachedUrl is also video)
-                    is_video = False
-                    if original_url and isinstance(original_url, str):
-                        is_video = any(ext in original_url.lower() for ext in ['.mp4', '.webm', '.mov', '.avi', 'video'])
-                    if content_type and "video" in content_type.lower():
-                        is_video = True
-                    
-                    logger.info(f"🔍 Checking top-level image FIRST (most reliable source):")
-                    logger.info(f"🔍   cachedUrl: {repr(cached_url)} (type: {type(cached_url).__name__})")
-                    logger.info(f"🔍   originalUrl: {original_url[:100] if original_url else 'None'}...")
-                    logger.info(f"🔍   pngUrl: {png_url[:100] if png_url else 'None'}...")
-                    logger.info(f"🔍   thumbnailUrl: {thumbnail_url[:100] if thumbnail_url else 'None'}...")
-                    
-                    # Helper function to check if URL is a video
-                    def is_video_url(url: str) -> bool:
-                        if not url:
-                            return False
-                        url_lower = url.lower()
-                        return any(ext in url_lower for ext in ['.mp4', '.webm', '.mov', '.avi', 'video'])
-                    
-                    # Check cachedUrl - but skip if it's a video file
-                    if cached_url and isinstance(cached_url, str) and cached_url.strip():
-                        if is_video or is_video_url(cached_url):
-                            logger.warning(f"⚠️ cachedUrl is a video file (detected from originalUrl/contentType), skipping: {cached_url[:80]}...")
-                            logger.info(f"⚠️ Will look for PNG/thumbnail instead for still image")
-                            # Don't use video URL - look for thumbnail/preview instead
-                        else:
-                            image_url = cached_url.strip()
-                            logger.info(f"✅ FOUND cachedUrl in top-level image (Alchemy CDN): {image_url}")
-                    # Check originalUrl - but skip if it's a video file
-                    elif original_url and isinstance(original_url, str) and original_url.strip():
-                        if is_video_url(original_url):
-                            logger.warning(f"⚠️ originalUrl is a video file, skipping: {original_url[:80]}...")
-                            # Don't use video URL - look for thumbnail/preview instead
-                        elif "nft-cdn.alchemy.com" in original_url:
-                            image_url = original_url.strip()
-                            logger.info(f"✅ FOUND originalUrl in top-level image (Alchemy CDN): {image_url[:80]}...")
-                        else:
-                            # Store as potential fallback (only if not video)
-                            if not image_url:
-                                image_url = original_url.strip()
-                                logger.info(f"Found originalUrl in top-level (not Alchemy CDN): {image_url[:80]}...")
-                    
-                    # If we don't have an image yet (or skipped video URLs), prefer thumbnail over PNG
-                    # Thumbnails are usually smaller and more reliable than full PNG conversions
-                    if not image_url:
-                        if thumbnail_url and isinstance(thumbnail_url, str) and thumbnail_url.strip():
-                            # Thumbnail URLs are usually still images, not videos, and are smaller/more reliable
-                            image_url = thumbnail_url.strip()
-                            logger.info(f"✅ FOUND thumbnailUrl in top-level (using as image - preferred over PNG): {image_url[:60]}...")
-                        elif png_url and isinstance(png_url, str) and png_url.strip():
-                            # PNG URLs are usually still images, not videos
-                            image_url = png_url.strip()
-                            logger.info(f"✅ FOUND pngUrl in top-level (using as image): {image_url[:60]}...")
-                        else:
-                            # Store Cloudinary URLs as fallback if we still don't have anything
-                            if png_url and isinstance(png_url, str) and png_url.strip():
-                                cloudinary_url = png_url.strip()
-                                logger.info(f"Found Cloudinary PNG in top-level (will use as fallback): {cloudinary_url[:60]}...")
-                            elif thumbnail_url and isinstance(thumbnail_url, str) and thumbnail_url.strip():
-                                if not cloudinary_url:
-                                    cloudinary_url = thumbnail_url.strip()
-                                    logger.info(f"Found Cloudinary thumbnail in top-level (will use as fallback): {cloudinary_url[:60]}...")
-                
-                # If we found Alchemy CDN URL in top-level, use it and skip other sources
-                if image_url and "nft-cdn.alchemy.com" in image_url:
-                    logger.info(f"✅ Using Alchemy CDN URL from top-level image, skipping other sources")
-                else:
-                    # Continue checking other sources if we didn't find Alchemy CDN URL
-                    # 1. Try media[0].gateway (can be string or dict)
-                    media = result.get("media", [])
-                    logger.info(f"Media array length: {len(media) if media else 0}")
-                    if media and len(media) > 0:
-                        media_item = media[0]
-                        # Log the full media item structure for debugging
-                        logger.info(f"Media item type: {type(media_item)}")
-                        if isinstance(media_item, dict):
-                            logger.info(f"Media item keys: {list(media_item.keys())}")
-                            # Log the full media item (truncated)
-                            logger.info(f"Media item (first 500 chars): {str(media_item)[:500]}")
-                        
-                        gateway_value = media_item.get('gateway') if isinstance(media_item, dict) else None
-                        raw_value = media_item.get('raw') if isinstance(media_item, dict) else None
-                        
-                        logger.info(f"Gateway type: {type(gateway_value)}, value: {str(gateway_value)[:100] if gateway_value else 'None'}")
-                        logger.info(f"Raw type: {type(raw_value)}, is_dict: {isinstance(raw_value, dict) if raw_value else False}")
-                        
-                        if isinstance(gateway_value, dict):
-                            logger.info(f"Gateway dict keys: {list(gateway_value.keys())}")
-                            logger.info(f"Gateway dict has pngUrl: {bool(gateway_value.get('pngUrl'))}")
-                            logger.info(f"Gateway dict has thumbnailUrl: {bool(gateway_value.get('thumbnailUrl'))}")
-                            if gateway_value.get('pngUrl'):
-                                logger.info(f"PNG URL found in gateway: {gateway_value.get('pngUrl')[:80]}...")
-                            if gateway_value.get('thumbnailUrl'):
-                                logger.info(f"Thumbnail URL found in gateway: {gateway_value.get('thumbnailUrl')[:80]}...")
-                        
-                        if isinstance(raw_value, dict):
-                            logger.info(f"Raw dict keys: {list(raw_value.keys())}")
-                            if raw_value.get('pngUrl'):
-                                logger.info(f"PNG URL found in raw: {raw_value.get('pngUrl')[:80]}...")
-                            if raw_value.get('thumbnailUrl'):
-                                logger.info(f"Thumbnail URL found in raw: {raw_value.get('thumbnailUrl')[:80]}...")
-                        
-                        # Check content type at media item level first
-                        content_type = media_item.get("contentType", "")
-                        is_video = "video" in content_type.lower() if content_type else False
-                        logger.debug(f"Content type: {content_type}, is_video: {is_video}")
-                        
-                        # Handle case where gateway is a dict with multiple URL options
-                        if isinstance(media_item.get("gateway"), dict):
-                            gateway_dict = media_item.get("gateway")
-                            # Also check contentType in the dict
-                            if not is_video:
-                                is_video = "video" in gateway_dict.get("contentType", "").lower()
-                            
-                            # Log what's available in the dict for debugging
-                            logger.debug(f"Gateway dict keys: {list(gateway_dict.keys())}")
-                            logger.debug(f"Has pngUrl: {bool(gateway_dict.get('pngUrl'))}")
-                            logger.debug(f"Has thumbnailUrl: {bool(gateway_dict.get('thumbnailUrl'))}")
-                            logger.debug(f"ContentType: {gateway_dict.get('contentType', 'unknown')}")
-                            
-                            # For embed images, prefer cachedUrl (Alchemy CDN) over Cloudinary URLs
-                            # Cloudinary URLs often return 400 errors, while Alchemy CDN works reliably
-                            # Note: cachedUrl may be large (>8MB) but works fine for Discord embeds
-                            gateway_cached = gateway_dict.get("cachedUrl")
-                            gateway_png = gateway_dict.get("pngUrl")
-                            gateway_thumb = gateway_dict.get("thumbnailUrl")
-                            gateway_original = gateway_dict.get("originalUrl")
-                            
-                            logger.info(f"🔍 Gateway dict URLs - cachedUrl: {bool(gateway_cached)}, pngUrl: {bool(gateway_png)}, thumbnailUrl: {bool(gateway_thumb)}, originalUrl: {bool(gateway_original)}")
-                            
-                            if gateway_cached and isinstance(gateway_cached, str) and gateway_cached.strip():
-                                image_url = gateway_cached.strip()
-                                logger.info(f"✅ SELECTED: cached URL from gateway (Alchemy CDN): {image_url}")
-                            elif gateway_original and isinstance(gateway_original, str) and gateway_original.strip():
-                                # Check if originalUrl is Alchemy CDN
-                                if "nft-cdn.alchemy.com" in gateway_original:
-                                    image_url = gateway_original.strip()
-                                    logger.info(f"✅ SELECTED: original URL from gateway (Alchemy CDN): {image_url[:60]}...")
-                                else:
-                                    image_url = gateway_original.strip()
-                                    logger.info(f"SELECTED: original URL from gateway: {image_url[:60]}...")
-                            elif gateway_png and isinstance(gateway_png, str) and gateway_png.strip():
-                                # Store Cloudinary URL as fallback, but continue checking for better URLs
-                                cloudinary_url = gateway_png.strip()
-                                logger.info(f"Found Cloudinary PNG URL in gateway (will use as fallback if no better URL found): {cloudinary_url[:60]}...")
-                                # Don't set image_url yet - continue checking other sources
-                            elif gateway_thumb and isinstance(gateway_thumb, str) and gateway_thumb.strip():
-                                # Store Cloudinary URL as fallback, but continue checking for better URLs
-                                if not cloudinary_url:  # Only use thumbnail if we don't have PNG
-                                    cloudinary_url = gateway_thumb.strip()
-                                    logger.info(f"Found Cloudinary thumbnail URL in gateway (will use as fallback if no better URL found): {cloudinary_url[:60]}...")
-                                # Don't set image_url yet - continue checking other sources
-                            elif is_video:
-                                # For videos without cached URL, log warning
-                                logger.warning(f"Video detected but no cached URL available. Available keys: {list(gateway_dict.keys())}")
-                                image_url = gateway_original if gateway_original else None
-                            else:
-                                # Last resort: originalUrl
-                                image_url = gateway_original if gateway_original else None
-                        else:
-                            # Gateway is a string URL directly
-                            image_url = media_item.get("gateway")
-                            logger.info(f"Gateway is a string URL: {image_url[:80] if image_url else 'None'}...")
-                            # Check if it's a video URL - if so, try to get PNG from raw
-                            if image_url and ("video" in content_type.lower() or ".mp4" in image_url.lower()):
-                                logger.info("Video URL detected in string gateway, checking raw for PNG/thumbnail")
-                                raw_item = media_item.get("raw")
-                                if isinstance(raw_item, dict):
-                                    if raw_item.get("pngUrl"):
-                                        image_url = raw_item.get("pngUrl")
-                                        logger.info(f"Found PNG URL in raw: {image_url[:80]}...")
-                                    elif raw_item.get("thumbnailUrl"):
-                                        image_url = raw_item.get("thumbnailUrl")
-                                        logger.info(f"Found thumbnail URL in raw: {image_url[:80]}...")
-                        
-                        # Fallback to raw if gateway didn't work
-                        if not image_url:
-                            raw_item = media_item.get("raw")
-                            if isinstance(raw_item, dict):
-                                if not is_video:
-                                    is_video = "video" in raw_item.get("contentType", "").lower()
-                                
-                                # Prefer cachedUrl (Alchemy CDN) over Cloudinary URLs for embeds
-                                if raw_item.get("cachedUrl"):
-                                    image_url = raw_item.get("cachedUrl")
-                                    logger.info(f"Using cached URL from raw (Alchemy CDN): {image_url[:60]}...")
-                                elif raw_item.get("pngUrl"):
-                                    image_url = raw_item.get("pngUrl")
-                                    logger.info(f"Using PNG URL from raw (Cloudinary): {image_url[:60]}...")
-                                elif raw_item.get("thumbnailUrl"):
-                                    image_url = raw_item.get("thumbnailUrl")
-                                    logger.info(f"Using thumbnail URL from raw (Cloudinary): {image_url[:60]}...")
-                                elif is_video:
-                                    logger.warning("Video in raw but no cached URL available")
-                                    image_url = raw_item.get("originalUrl")
-                                else:
-                                    image_url = raw_item.get("originalUrl")
-                            else:
-                                image_url = raw_item
-                    
-                    # 2. Try metadata.image
-                    if not image_url:
-                        metadata = result.get("metadata", {})
-                        logger.info(f"Metadata type: {type(metadata)}, keys: {list(metadata.keys()) if isinstance(metadata, dict) else 'N/A'}")
-                        if metadata:
-                            meta_image = metadata.get("image")
-                            logger.info(f"Metadata image type: {type(meta_image)}, value: {str(meta_image)[:200] if meta_image else 'None'}")
-                            # Handle dict case
-                            if isinstance(meta_image, dict):
-                                logger.info(f"Metadata image dict keys: {list(meta_image.keys())}")
-                                # Prefer cachedUrl for embeds
-                                if meta_image.get("cachedUrl"):
-                                    image_url = meta_image.get("cachedUrl")
-                                    logger.info(f"Using cached URL from metadata.image (Alchemy CDN): {image_url[:80]}...")
-                                elif meta_image.get("pngUrl"):
-                                    image_url = meta_image.get("pngUrl")
-                                    logger.info(f"Using PNG URL from metadata.image (Cloudinary): {image_url[:80]}...")
-                                elif meta_image.get("thumbnailUrl"):
-                                    image_url = meta_image.get("thumbnailUrl")
-                                    logger.info(f"Using thumbnail URL from metadata.image (Cloudinary): {image_url[:80]}...")
-                                else:
-                                    image_url = meta_image.get("originalUrl")
-                            else:
-                                image_url = meta_image
-                    
-                    # Final fallback: Use Cloudinary URL only if we have nothing else
-                    if not image_url and cloudinary_url:
-                        image_url = cloudinary_url
-                        logger.warning(f"⚠️  FINAL FALLBACK: Using Cloudinary URL (may return 400): {image_url[:60]}...")
-                        logger.warning(f"⚠️  WARNING: No Alchemy CDN URL found, using Cloudinary which may fail!")
-                
-                # Log where the image URL came from
+            if image_url:
+                image_url = _normalize_image_url(image_url, ipfs_gateway)
                 if image_url:
-                    logger.info(f"Final image URL source determined, type: {type(image_url)}")
-                
-                # Ensure image_url is a string (not a dict or other type)
-                if image_url and isinstance(image_url, str):
-                    # Convert IPFS URLs - try multiple gateways
-                    if image_url.startswith("ipfs://"):
-                        # Extract IPFS hash
-                        ipfs_hash = image_url.replace("ipfs://", "").replace("ipfs/", "")
-                        # Use Cloudflare IPFS gateway (more reliable than ipfs.io)
-                        image_url = f"https://cloudflare-ipfs.com/ipfs/{ipfs_hash}"
-                        logger.debug(f"Converted IPFS URL to: {image_url[:50]}...")
-                    elif "/ipfs/" in image_url and not image_url.startswith("http"):
-                        # Handle IPFS URLs that might be missing protocol
-                        if image_url.startswith("ipfs/"):
-                            image_url = f"https://cloudflare-ipfs.com/{image_url}"
-                    
-                    # Clean up URL (remove query params that might cause issues)
-                    if "?" in image_url:
-                        image_url = image_url.split("?")[0]
-                    
-                    # Validate URL
-                    if image_url.startswith(("http://", "https://")):
-                        # Discord has issues with very long URLs, truncate if needed
-                        if len(image_url) > 2000:
-                            logger.warning(f"Image URL too long ({len(image_url)} chars), truncating")
-                            image_url = image_url[:2000]
-                        
-                        image_urls.append(image_url)
-                        logger.info(f"Found image URL: {image_url[:80]}...")
-                    else:
-                        logger.warning(f"Invalid image URL format: {image_url[:50] if image_url else 'None'}")
-                elif image_url:
-                    # Log if we got a non-string image URL
-                    logger.warning(f"Image URL is not a string (type: {type(image_url)}): {image_url}")
-                else:
-                    logger.debug("No image URL found in NFT metadata")
-            
-            # Small delay between batches
-            if i + batch_size < len(token_ids):
-                await asyncio.sleep(0.1)
+                    image_urls.append(image_url)
+                    logger.info("Found image URL: %.80s...", image_url)
+            else:
+                logger.debug("No image URL found in NFT metadata")
         
         logger.info(f"Fetched {len(image_urls)} image(s) for {len(token_ids)} token(s)")
         if not image_urls:
@@ -936,286 +1520,347 @@ class SalesFetcher:
             return None
         
         # Pattern: .../ipfs/HASH/TOKEN_ID.mp4
-        if '/ipfs/' in video_url:
-            parts = video_url.split('/ipfs/')
-            if len(parts) > 1:
-                rest = parts[1]
-                # Split by / to get hash and filename
-                hash_and_file = rest.split('/')
-                if len(hash_and_file) >= 2:
-                    ipfs_hash = hash_and_file[0].split('?')[0].split('#')[0]  # Remove query params
-                    filename = hash_and_file[1].split('?')[0].split('#')[0]  # Remove query params
-                    # Extract token ID from filename (e.g., "2665.mp4" -> "2665")
-                    if '.' in filename:
-                        token_id = filename.split('.')[0]
-                        if ipfs_hash and token_id:
-                            return (ipfs_hash, token_id)
+        match = _IPFS_VIDEO_URL_RE.search(video_url)
+        if match:
+            return match.group(1, 2)
         return None
     
-    def _extract_ipfs_hash(self, url_or_hash: str) -> Optional[str]:
+    async def _fetch_metadata_from_ipfs(self, ipfs_hash: str) -> Optional[dict]:
         """
-        Extract IPFS hash from various URL formats.
+        Fetch NFT metadata JSON directly from IPFS.
+        Results are kept in a memory LRU, since CIDs are content-addressed.
         
         Args:
-            url_or_hash: IPFS URL or hash (e.g., "ipfs://Qm...", "https://ipfs.io/ipfs/Qm...", "Qm...")
+            ipfs_hash: IPFS hash (CID) of the metadata
             
         Returns:
-            IPFS hash (CID) or None
+            Metadata JSON as dict, or None if failed
         """
-        if not url_or_hash:
-            return None
-        
-        # Remove common IPFS URL prefixes
-        hash_str = url_or_hash
-        if hash_str.startswith("ipfs://"):
-            hash_str = hash_str.replace("ipfs://", "")
-        elif "ipfs/" in hash_str:
-            # Extract hash from URL like "https://ipfs.io/ipfs/Qm..." or "/ipfs/Qm..."
-            parts = hash_str.split("ipfs/")
-            if len(parts) > 1:
-                hash_str = parts[1].split("?")[0].split("#")[0]  # Remove query params and fragments
-        elif hash_str.startswith("Qm") or hash_str.startswith("baf"):
-            # Already a hash
-            pass
-        else:
+        if not ipfs_hash:
             return None
         
-        # Clean up - remove any trailing slashes or paths
-        hash_str = hash_str.strip("/").split("/")[0]
-        
-        # Validate it looks like an IPFS hash (Qm... for CIDv0, baf... for CIDv1)
-        if hash_str.startswith(("Qm", "baf")) and len(hash_str) > 10:
-            return hash_str
+        # Check memory cache first (move to end for LRU)
+        if ipfs_hash in self._ipfs_metadata_cache:
+            self._ipfs_metadata_cache.move_to_end(ipfs_hash)
+            return self._ipfs_metadata_cache[ipfs_hash]
         
-        return None
+        data = await self._race_ipfs_gateways(ipfs_hash)
+        if data is not None:
+            self._cache_ipfs_metadata(ipfs_hash, data)
+        return data
     
-    async def _fetch_metadata_from_ipfs(self, ipfs_hash: str) -> Optional[dict]:
+    def _cache_ipfs_metadata(self, ipfs_hash: str, data: dict):
+        """Store IPFS metadata in the memory LRU, evicting the oldest entries if over limit."""
+        self._ipfs_metadata_cache[ipfs_hash] = data
+        while len(self._ipfs_metadata_cache) > MAX_IPFS_CACHE_SIZE:
+            self._ipfs_metadata_cache.popitem(last=False)
+    
+    async def _race_ipfs_gateways(self, ipfs_hash: str) -> Optional[dict]:
         """
-        Fetch NFT metadata JSON directly from IPFS.
+        Fetch NFT metadata JSON from whichever IPFS gateway answers first.
         
         Args:
             ipfs_hash: IPFS hash (CID) of the metadata
             
         Returns:
-            Metadata JSON as dict, or None if failed
+            Metadata JSON as dict, or None if every gateway failed
         """
-        if not ipfs_hash:
-            return None
-        
-        # Try multiple IPFS gateways (Cloudflare first - fastest)
-        gateways = [
-            "https://cloudflare-ipfs.com/ipfs/",
-            "https://ipfs.io/ipfs/",
-        ]
-        
         session = await self._get_session()
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'application/json',
-        }
+        headers = IPFS_METADATA_HEADERS
         
-        for gateway in gateways:
-            try:
-                url = f"{gateway}{ipfs_hash}"
-                logger.debug(f"Trying to fetch metadata from IPFS: {url[:80]}...")
-                async with session.get(
-                    url,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=2)  # Shorter timeout - 2 seconds max
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        logger.info(f"Successfully fetched metadata from IPFS gateway: {gateway}")
+        # Race the gateways - best-ranked starts first, the rest are hedged in shortly after
+        # so a slow or broken gateway no longer delays the others
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + IPFS_GATEWAY_TIMEOUT
+        pending = {
+            asyncio.create_task(self._fetch_from_ipfs_gateway(
+                session, gateway, ipfs_hash, headers, deadline, rank * IPFS_GATEWAY_HEDGE_DELAY
+            ))
+            for rank, gateway in enumerate(self._ranked_ipfs_gateways())
+        }
+        try:
+            while pending:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    data = task.result()
+                    if data is _NOT_IPFS_METADATA:
+                        return None
+                    if data is not None:
                         return data
-                    else:
-                        logger.debug(f"IPFS gateway {gateway} returned {response.status}")
-            except asyncio.TimeoutError:
-                logger.debug(f"IPFS gateway {gateway} timed out")
-                continue
-            except Exception as e:
-                logger.debug(f"Failed to fetch from {gateway}: {e}")
-                continue
+        finally:
+            for task in pending:
+                task.cancel()
         
         logger.debug(f"Failed to fetch metadata from IPFS hash: {ipfs_hash}")
         return None
     
-    async def _get_ipfs_image_urls_internal(self, token_id: str) -> List[str]:
+    def _ranked_ipfs_gateways(self) -> List[str]:
+        """
+        Order IPFS gateways by recent success rate, then by average latency.
+        
+        Gateways without history rank first so they get tried.
+        
+        Returns:
+            Gateway URL prefixes, best first
+        """
+        def rank(gateway: str) -> Tuple[float, float]:
+            stats = self._gateway_stats.get(gateway)
+            if not stats:
+                return (0.0, 0.0)
+            successes = sum(1 for _, success in stats if success)
+            return (-successes / len(stats), sum(elapsed for elapsed, _ in stats) / len(stats))
+        
+        return sorted(IPFS_GATEWAYS, key=rank)
+    
+    def _best_ipfs_gateway(self) -> str:
+        """Get the currently best-ranked IPFS gateway URL prefix (ending in /ipfs/)."""
+        return self._ranked_ipfs_gateways()[0]
+    
+    async def _fetch_from_ipfs_gateway(
+        self,
+        session: aiohttp.ClientSession,
+        gateway: str,
+        ipfs_hash: str,
+        headers: dict,
+        deadline: float,
+        delay: float = 0
+    ) -> Optional[dict]:
+        """
+        Fetch metadata JSON from a single IPFS gateway, recording its latency and outcome.
+        
+        Args:
+            session: Shared HTTP session
+            gateway: Gateway URL prefix (ending in /ipfs/)
+            ipfs_hash: IPFS hash (CID) of the metadata
+            headers: Request headers
+            deadline: Event loop time by which the race must finish
+            delay: Seconds to wait before starting (hedging behind better gateways)
+            
+        Returns:
+            Metadata JSON as dict, _NOT_IPFS_METADATA if the gateway served something
+            other than a JSON object, or None if failed
+        """
+        if delay:
+            await asyncio.sleep(delay)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        stats = self._gateway_stats.setdefault(gateway, deque(maxlen=IPFS_GATEWAY_STATS_WINDOW))
+        try:
+            url = f"{gateway}{ipfs_hash}"
+            logger.debug("Trying to fetch metadata from IPFS: %.80s...", url)
+            async with session.get(
+                url,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=max(deadline - start, 0.1))
+            ) as response:
+                if response.status == 200:
+                    # Read with a size cap - a CID pointing at an image/video would otherwise
+                    # download the whole file just to fail JSON parsing
+                    body = bytearray()
+                    if response.content_length is not None and response.content_length <= MAX_IPFS_METADATA_BYTES:
+                        # Size known up front and within the cap - read it in one go
+                        body = await response.read()
+                    elif response.content_length is None:
+                        async for chunk in response.content.iter_chunked(64 * 1024):
+                            body += chunk
+                            if len(body) > MAX_IPFS_METADATA_BYTES:
+                                break
+                    # The gateway did its job whatever the body turns out to be, so rank it as a success
+                    stats.append((loop.time() - start, True))
+                    data = None
+                    if body and len(body) <= MAX_IPFS_METADATA_BYTES:
+                        # Gateways often serve JSON as text/plain, so decode the body directly
+                        try:
+                            data = _json_loads(body)
+                        except ValueError:
+                            # orjson.JSONDecodeError and json.JSONDecodeError both subclass ValueError
+                            pass
+                    if not isinstance(data, dict):
+                        # The CID is an image/video (or other non-metadata) - every gateway would say the same
+                        logger.debug("IPFS gateway %s response for %s is not metadata JSON, skipping", gateway, ipfs_hash)
+                        return _NOT_IPFS_METADATA
+                    logger.info(f"Successfully fetched metadata from IPFS gateway: {gateway}")
+                    return data
+                else:
+                    logger.debug("IPFS gateway %s returned %s", gateway, response.status)
+        except asyncio.CancelledError:
+            # Losing the race isn't a failure, but running out the clock is
+            if loop.time() >= deadline:
+                stats.append((loop.time() - start, False))
+            raise
+        except asyncio.TimeoutError:
+            logger.debug("IPFS gateway %s timed out", gateway)
+        except Exception as e:
+            logger.debug("Failed to fetch from %s: %s", gateway, e)
+        stats.append((loop.time() - start, False))
+        return None
+    
+    async def _get_ipfs_image_urls_internal(
+        self,
+        token_id: str,
+        metadata: Optional[dict] = None
+    ) -> List[str]:
         """
         Internal method to get IPFS image URLs (without timeout wrapper).
         """
         try:
-            # First, get metadata from Alchemy to find the tokenURI/IPFS hash
-            metadata = await self.get_nft_metadata(token_id)
+            # First, get metadata from Alchemy to find the tokenURI/IPFS hash (unless already loaded)
+            if metadata is None:
+                metadata = await self.get_nft_metadata(token_id)
             if not metadata:
                 return []
             
+            # Single pass over the Alchemy metadata: metadata JSON hashes to fetch, plus image hashes
+            # referenced directly (thumbnail URLs in Alchemy's processed metadata are often more reliable)
             ipfs_hashes = []
-            
-            # 1. Check tokenUri field (most common)
-            token_uri = metadata.get("tokenUri", {})
-            if isinstance(token_uri, dict):
-                raw_uri = token_uri.get("raw", "")
-                if raw_uri:
-                    ipfs_hash = self._extract_ipfs_hash(raw_uri)
-                    if ipfs_hash:
-                        ipfs_hashes.append(ipfs_hash)
-            elif isinstance(token_uri, str):
-                ipfs_hash = self._extract_ipfs_hash(token_uri)
-                if ipfs_hash:
-                    ipfs_hashes.append(ipfs_hash)
-            
-            # 2. Check metadata.raw.originalUrl (might contain IPFS hash)
-            meta_raw = metadata.get("metadata", {}).get("raw", {})
-            if isinstance(meta_raw, dict):
-                original_url = meta_raw.get("originalUrl", "")
-                if original_url:
-                    ipfs_hash = self._extract_ipfs_hash(original_url)
-                    if ipfs_hash:
-                        ipfs_hashes.append(ipfs_hash)
-            
-            # 3. Check media[0].raw.originalUrl
-            media = metadata.get("media", [])
-            if media and len(media) > 0:
-                media_raw = media[0].get("raw", {})
-                if isinstance(media_raw, dict):
-                    original_url = media_raw.get("originalUrl", "")
-                    if original_url:
-                        ipfs_hash = self._extract_ipfs_hash(original_url)
-                        if ipfs_hash:
-                            ipfs_hashes.append(ipfs_hash)
-            
-            # 4. Check top-level image.originalUrl
-            top_image = metadata.get("image", {})
-            if isinstance(top_image, dict):
-                original_url = top_image.get("originalUrl", "")
-                if original_url:
-                    ipfs_hash = self._extract_ipfs_hash(original_url)
+            seen_hashes = set()
+            image_hashes = []
+            for path, is_image in IPFS_HASH_SOURCES:
+                source = _resolve_path(metadata, path)
+                if is_image:
+                    ipfs_hash = self._ipfs_hash_from_image_source(source)
                     if ipfs_hash:
+                        image_hashes.append((path, ipfs_hash))
+                elif source and isinstance(source, str):
+                    ipfs_hash = _extract_ipfs_hash(source)
+                    if ipfs_hash and ipfs_hash not in seen_hashes:
+                        seen_hashes.add(ipfs_hash)
                         ipfs_hashes.append(ipfs_hash)
             
-            # Remove duplicates
-            ipfs_hashes = list(set(ipfs_hashes))
-            
             if not ipfs_hashes:
-                logger.debug(f"No IPFS hashes found in metadata for token {token_id}")
+                logger.debug("No IPFS hashes found in metadata for token %s", token_id)
                 return []
             
-            # Fetch metadata JSON from IPFS
+            # Fetch metadata JSON for all hashes from IPFS in parallel, reading results in priority order
             image_urls = []
-            for ipfs_hash in ipfs_hashes:
-                try:
-                    ipfs_metadata = await self._fetch_metadata_from_ipfs(ipfs_hash)
-                    if ipfs_metadata:
-                        # PRIORITY 1: Look for thumbnail/preview fields first (for video NFTs)
-                        thumbnail_fields = [
-                            "thumbnail", "thumbnail_image", "thumbnailImage", 
-                            "preview", "preview_image", "previewImage",
-                            "image_thumbnail", "imageThumbnail",
-                            "poster", "poster_image", "posterImage"
-                        ]
-                        
-                        thumbnail_found = False
-                        for thumb_field in thumbnail_fields:
-                            thumb_value = ipfs_metadata.get(thumb_field)
-                            if thumb_value:
-                                thumb_hash = self._extract_ipfs_hash(thumb_value)
-                                if thumb_hash:
-                                    image_urls.append(f"https://cloudflare-ipfs.com/ipfs/{thumb_hash}")
-                                    logger.info(f"Found IPFS thumbnail hash for token {token_id} from field '{thumb_field}': {thumb_hash[:20]}...")
-                                    thumbnail_found = True
-                                    break
-                        
-                        # PRIORITY 2: Check if image field is a video, if so skip it
-                        image_field = ipfs_metadata.get("image", "")
-                        if image_field:
-                            # Check if it's a video file
-                            is_video = False
-                            if isinstance(image_field, str):
-                                is_video = any(ext in image_field.lower() for ext in ['.mp4', '.webm', '.mov', '.avi', 'video'])
-                            
-                            # Also check animation_url (often used for videos)
-                            animation_url = ipfs_metadata.get("animation_url", "") or ipfs_metadata.get("animationUrl", "")
-                            if animation_url and image_field == animation_url:
-                                is_video = True
-                                logger.info(f"Image field matches animation_url (likely video), skipping for token {token_id}")
-                            
-                            # Only use image field if it's NOT a video (or if we didn't find a thumbnail)
-                            if not is_video or not thumbnail_found:
-                                image_hash = self._extract_ipfs_hash(image_field)
-                                if image_hash:
-                                    # Skip if it's clearly a video file
-                                    if not any(ext in image_hash.lower() for ext in ['.mp4', '.webm', '.mov']):
-                                        image_urls.append(f"https://cloudflare-ipfs.com/ipfs/{image_hash}")
-                                        logger.info(f"Found IPFS image hash for token {token_id}: {image_hash[:20]}...")
-                                    else:
-                                        logger.debug(f"Skipping video file from image field: {image_hash[:20]}...")
-                except Exception as e:
-                    logger.debug(f"Error fetching IPFS metadata for hash {ipfs_hash}: {e}")
-                    continue
+            seen_urls = set()
             
-            # Also try to extract thumbnail/IPFS hash directly from Alchemy metadata
-            # Check for thumbnail URLs in Alchemy's processed metadata (these are often more reliable)
-            for source_name in ["image", "metadata.image", "media.raw.originalUrl"]:
-                try:
-                    if source_name == "image":
-                        img_data = metadata.get("image", {})
-                    elif source_name == "metadata.image":
-                        img_data = metadata.get("metadata", {}).get("image", {})
-                    else:
-                        media = metadata.get("media", [])
-                        img_data = media[0].get("raw", {}).get("originalUrl", "") if media else ""
-                    
-                    # If it's a dict, prioritize thumbnailUrl and pngUrl over originalUrl
-                    if isinstance(img_data, dict):
-                        # Check for thumbnail first
-                        thumbnail_url = img_data.get("thumbnailUrl") or img_data.get("thumbnail")
-                        if thumbnail_url:
-                            ipfs_hash = self._extract_ipfs_hash(thumbnail_url)
-                            if ipfs_hash:
-                                image_urls.append(f"https://cloudflare-ipfs.com/ipfs/{ipfs_hash}")
-                                logger.info(f"Found thumbnail from {source_name} for token {token_id}")
-                                continue
-                        
-                        # Then check PNG URL
-                        png_url = img_data.get("pngUrl")
-                        if png_url:
-                            ipfs_hash = self._extract_ipfs_hash(png_url)
-                            if ipfs_hash:
-                                image_urls.append(f"https://cloudflare-ipfs.com/ipfs/{ipfs_hash}")
-                                logger.info(f"Found PNG from {source_name} for token {token_id}")
-                                continue
-                        
-                        # Last resort: originalUrl (but skip if it's a video)
-                        original_url = img_data.get("originalUrl", "")
-                        if original_url:
-                            # Skip if it's clearly a video
-                            if not any(ext in original_url.lower() for ext in ['.mp4', '.webm', '.mov', 'video']):
-                                ipfs_hash = self._extract_ipfs_hash(original_url)
-                                if ipfs_hash:
-                                    image_urls.append(f"https://cloudflare-ipfs.com/ipfs/{ipfs_hash}")
-                    elif isinstance(img_data, str):
-                        # Skip if it's a video file
-                        if not any(ext in img_data.lower() for ext in ['.mp4', '.webm', '.mov']):
-                            ipfs_hash = self._extract_ipfs_hash(img_data)
-                            if ipfs_hash:
-                                image_urls.append(f"https://cloudflare-ipfs.com/ipfs/{ipfs_hash}")
-                except Exception as e:
-                    logger.debug(f"Error extracting IPFS hash from {source_name}: {e}")
-            
-            # Remove duplicates
-            image_urls = list(dict.fromkeys(image_urls))  # Preserves order
+            def add_url(url: str) -> None:
+                if url not in seen_urls:
+                    seen_urls.add(url)
+                    image_urls.append(url)
+            
+            gateway = self._best_ipfs_gateway()
+            fetches = [asyncio.ensure_future(self._fetch_metadata_from_ipfs(ipfs_hash)) for ipfs_hash in ipfs_hashes]
+            try:
+                for ipfs_hash, fetch in zip(ipfs_hashes, fetches):
+                    try:
+                        ipfs_metadata = await fetch
+                    except Exception as e:
+                        logger.debug("Error fetching IPFS metadata for hash %s: %s", ipfs_hash, e)
+                        continue
+                    if ipfs_metadata:
+                        try:
+                            for url in self._extract_urls_from_ipfs_meta(ipfs_metadata, token_id, gateway):
+                                add_url(url)
+                        except Exception as e:
+                            logger.debug("Error reading IPFS metadata for hash %s: %s", ipfs_hash, e)
+            finally:
+                # No-op for finished fetches; drops the rest on a timeout
+                for fetch in fetches:
+                    fetch.cancel()
+            
+            # Then the image hashes referenced directly by Alchemy's metadata
+            for path, ipfs_hash in image_hashes:
+                add_url(f"{gateway}{ipfs_hash}")
+                logger.debug("Found IPFS image from %s for token %s", path, token_id)
             
             if image_urls:
                 logger.info(f"Found {len(image_urls)} IPFS image URL(s) for token {token_id}")
             else:
-                logger.debug(f"No IPFS image URLs found for token {token_id}")
+                logger.debug("No IPFS image URLs found for token %s", token_id)
             
             return image_urls
         except Exception as e:
             logger.error(f"Error getting IPFS image URLs for token {token_id}: {e}")
             return []
     
-    async def get_ipfs_image_urls(self, token_id: str, timeout: float = 5.0) -> List[str]:
+    def _ipfs_hash_from_image_source(self, img_data) -> Optional[str]:
+        """
+        Get a still-image IPFS hash from an Alchemy image source.
+        
+        Args:
+            img_data: Image URL, or dict of image URLs (thumbnailUrl/pngUrl/originalUrl)
+            
+        Returns:
+            IPFS hash (CID) or None
+        """
+        # If it's a dict, prioritize thumbnailUrl and pngUrl over originalUrl
+        if isinstance(img_data, dict):
+            for key in IPFS_STILL_IMAGE_KEYS:
+                url = img_data.get(key)
+                if url and isinstance(url, str):
+                    ipfs_hash = _extract_ipfs_hash(url)
+                    if ipfs_hash:
+                        return ipfs_hash
+            # Last resort: originalUrl (checked below like a plain URL)
+            img_data = img_data.get("originalUrl")
+        
+        # Skip if it's clearly a video
+        if img_data and isinstance(img_data, str) and not _VIDEO_RE.search(img_data):
+            return _extract_ipfs_hash(img_data)
+        return None
+    
+    def _extract_urls_from_ipfs_meta(self, ipfs_metadata: dict, token_id: str, gateway: str) -> List[str]:
+        """
+        Get still-image URLs from an NFT's IPFS metadata JSON.
+        
+        Args:
+            ipfs_metadata: Metadata JSON fetched from IPFS
+            token_id: Token ID (for logging)
+            gateway: Gateway URL prefix (ending in /ipfs/) for the returned URLs
+            
+        Returns:
+            Gateway URLs, thumbnails/previews first
+        """
+        urls = []
+        
+        # PRIORITY 1: Look for thumbnail/preview fields first (for video NFTs)
+        thumbnail_found = False
+        for thumb_field in IPFS_THUMBNAIL_FIELDS:
+            thumb_value = ipfs_metadata.get(thumb_field)
+            if thumb_value and isinstance(thumb_value, str):
+                thumb_hash = _extract_ipfs_hash(thumb_value)
+                if thumb_hash:
+                    urls.append(f"{gateway}{thumb_hash}")
+                    logger.info(f"Found IPFS thumbnail hash for token {token_id} from field '{thumb_field}': {thumb_hash[:20]}...")
+                    thumbnail_found = True
+                    break
+        
+        # PRIORITY 2: Check if image field is a video, if so skip it
+        image_field = ipfs_metadata.get("image", "")
+        if image_field:
+            # Check if it's a video file
+            is_video = False
+            if isinstance(image_field, str):
+                is_video = bool(_VIDEO_RE.search(image_field))
+        
+            # Also check animation_url (often used for videos)
+            animation_url = ipfs_metadata.get("animation_url", "") or ipfs_metadata.get("animationUrl", "")
+            if animation_url and image_field == animation_url:
+                is_video = True
+                logger.info(f"Image field matches animation_url (likely video), skipping for token {token_id}")
+        
+            # Only use image field if it's NOT a video (or if we didn't find a thumbnail)
+            if isinstance(image_field, str) and (not is_video or not thumbnail_found):
+                image_hash = _extract_ipfs_hash(image_field)
+                if image_hash:
+                    urls.append(f"{gateway}{image_hash}")
+                    logger.info(f"Found IPFS image hash for token {token_id}: {image_hash[:20]}...")
+        
+        return urls
+    
+    async def get_ipfs_image_urls(
+        self,
+        token_id: str,
+        timeout: float = 5.0,
+        metadata: Optional[dict] = None
+    ) -> List[str]:
         """
         Get IPFS image URLs for a token with timeout protection.
         
@@ -1225,13 +1870,14 @@ class SalesFetcher:
         Args:
             token_id: Token ID to get IPFS URLs for
             timeout: Maximum seconds to wait (default 5.0)
+            metadata: Alchemy metadata for the token, if the caller already has it
             
         Returns:
             List of IPFS image URLs, or empty list if timeout/error
         """
         try:
             return await asyncio.wait_for(
-                self._get_ipfs_image_urls_internal(token_id),
+                self._get_ipfs_image_urls_internal(token_id, metadata),
                 timeout=timeout
             )
         except asyncio.TimeoutError:
@@ -1255,111 +1901,44 @@ class SalesFetcher:
         """
         ipfs_urls = []  # Initialize outside try block for exception handler
         try:
-            # FIRST: Try to get IPFS URLs directly (most reliable source)
-            ipfs_urls = await self.get_ipfs_image_urls(token_id)
-            
-            # SECOND: Get Alchemy metadata URLs as fallback
+            # Fetch Alchemy metadata once - both the IPFS lookup and the fallback URLs use it
             metadata = await self.get_nft_metadata(token_id)
             if not metadata:
-                # If no metadata but we have IPFS URLs, return those
-                return ipfs_urls if ipfs_urls else []
-            
-            urls = []
-            
-            # Extract URLs from all possible sources
-            def extract_urls_from_dict(d: dict, source_name: str = ""):
-                """Helper to extract URLs from a dict in priority order"""
-                if not isinstance(d, dict):
-                    return []
-                found = []
-                # Priority: thumbnailUrl (smallest) -> pngUrl -> cachedUrl -> originalUrl
-                if d.get("thumbnailUrl"):
-                    found.append(("thumbnailUrl", d.get("thumbnailUrl")))
-                if d.get("pngUrl"):
-                    found.append(("pngUrl", d.get("pngUrl")))
-                if d.get("cachedUrl"):
-                    found.append(("cachedUrl", d.get("cachedUrl")))
-                if d.get("originalUrl"):
-                    found.append(("originalUrl", d.get("originalUrl")))
-                return found
-            
-            # 1. Check media[0].gateway
-            media = metadata.get("media", [])
-            if media and len(media) > 0:
-                media_item = media[0]
-                gateway = media_item.get("gateway")
-                if isinstance(gateway, dict):
-                    urls.extend(extract_urls_from_dict(gateway, "media.gateway"))
-                elif isinstance(gateway, str):
-                    urls.append(("media.gateway", gateway))
-                
-                # Also check raw
-                raw = media_item.get("raw")
-                if isinstance(raw, dict):
-                    urls.extend(extract_urls_from_dict(raw, "media.raw"))
-                elif isinstance(raw, str):
-                    urls.append(("media.raw", raw))
-            
-            # 2. Check metadata.image
-            meta_image = metadata.get("metadata", {}).get("image")
-            if isinstance(meta_image, dict):
-                urls.extend(extract_urls_from_dict(meta_image, "metadata.image"))
-            elif isinstance(meta_image, str):
-                urls.append(("metadata.image", meta_image))
-            
-            # 3. Check top-level image
-            top_image = metadata.get("image")
-            if isinstance(top_image, dict):
-                urls.extend(extract_urls_from_dict(top_image, "image"))
-            elif isinstance(top_image, str):
-                urls.append(("image", top_image))
-            
-            # Remove duplicates while preserving order (priority: thumbnailUrl > pngUrl > cachedUrl > originalUrl)
+                # No metadata means no tokenURI/IPFS hash to look up either
+                return []
+            
+            # FIRST: Try to get IPFS URLs directly (most reliable source)
+            ipfs_urls = await self.get_ipfs_image_urls(token_id, metadata=metadata)
+            
+            # SECOND: Alchemy metadata URLs as fallback, extracted from all possible sources
+            # Each URL is tagged with its numeric priority as it is collected (lower is better)
             seen = set()
             priority_order = []
-            for source, url in urls:
-                if url and url not in seen:
-                    seen.add(url)
-                    priority_order.append((source, url))
-            
-            # Sort by priority: thumbnailUrl first, then pngUrl, then cachedUrl, then originalUrl
-            def get_priority(item):
-                source, url = item
-                if "thumbnailUrl" in source.lower() or "thumbnail" in source.lower():
-                    return 0
-                elif "pngUrl" in source.lower() or "png" in source.lower():
-                    return 1
-                elif "cachedUrl" in source.lower() or "cached" in source.lower():
-                    return 2
-                elif "originalUrl" in source.lower() or "original" in source.lower():
-                    return 3
+            for path in ALL_IMAGE_URL_SOURCES:
+                source = _resolve_path(metadata, path)
+                if isinstance(source, dict):
+                    # Priority: thumbnailUrl (smallest) -> pngUrl -> cachedUrl -> originalUrl
+                    candidates = [(priority, source.get(key)) for priority, key in enumerate(IMAGE_URL_PRIORITY_KEYS)]
+                elif isinstance(source, str):
+                    candidates = [(RAW_IMAGE_URL_PRIORITY, source)]
                 else:
-                    return 4
-            
-            priority_order.sort(key=get_priority)
+                    continue
+                # Remove duplicates while preserving first-seen order
+                for priority, url in candidates:
+                    if url and url not in seen:
+                        seen.add(url)
+                        priority_order.append((priority, url))
             
-            # Return just the URLs
-            result = [url for _, url in priority_order]
+            # Stable sort, so URLs with equal priority keep their source order
+            priority_order.sort(key=lambda item: item[0])
             
-            # Convert IPFS URLs
-            for i, url in enumerate(result):
-                if url and isinstance(url, str):
-                    if url.startswith("ipfs://"):
-                        ipfs_hash = url.replace("ipfs://", "").replace("ipfs/", "")
-                        result[i] = f"https://cloudflare-ipfs.com/ipfs/{ipfs_hash}"
-                    elif "/ipfs/" in url and not url.startswith("http"):
-                        if url.startswith("ipfs/"):
-                            result[i] = f"https://cloudflare-ipfs.com/ipfs/{url.replace('ipfs/', '')}"
+            # Return just the URLs, with IPFS URIs converted to gateway URLs
+            gateway = self._best_ipfs_gateway()
+            result = [_ipfs_gateway_url(url, gateway) for _, url in priority_order if isinstance(url, str)]
             
             # Combine: IPFS URLs first (most reliable), then Alchemy URLs
             # Remove duplicates while preserving order
-            all_urls = ipfs_urls + result
-            seen = set()
-            final_urls = []
-            for url in all_urls:
-                if url and url not in seen:
-                    seen.add(url)
-                    final_urls.append(url)
+            final_urls = list(dict.fromkeys(url for url in ipfs_urls + result if url))
             
             logger.info(f"Found {len(final_urls)} image URL(s) for token {token_id} ({len(ipfs_urls)} IPFS, {len(result)} Alchemy) in priority order")
             return final_urls
@@ -1370,80 +1949,173 @@ class SalesFetcher:
                 return ipfs_urls
             return []
     
+    def _cache_image(self, image_url: str, etag: str, image_data: bytes):
+        """Store a downloaded image in the LRU, evicting the oldest entries if over either limit."""
+        previous = self._image_cache.pop(image_url, None)
+        if previous:
+            self._image_cache_bytes -= len(previous[1])
+        self._image_cache[image_url] = (etag, image_data)
+        self._image_cache_bytes += len(image_data)
+        while len(self._image_cache) > MAX_IMAGE_CACHE_SIZE or self._image_cache_bytes > MAX_IMAGE_CACHE_BYTES:
+            _, (_, evicted) = self._image_cache.popitem(last=False)
+            self._image_cache_bytes -= len(evicted)
+    
     async def download_image(self, image_url: str) -> Optional[bytes]:
         """
         Download image from URL and return as bytes.
         More reliable than using embed images.
         
+        Images on a known IPFS gateway are raced across all gateways, so one slow
+        or failing gateway doesn't lose the image.
+        
+        Args:
+            image_url: Image URL to download
+            
+        Returns:
+            Image bytes, or None if download fails
+        """
+        match = _IPFS_GATEWAY_URL_RE.match(image_url)
+        if match:
+            return await self._race_ipfs_image(match.group(1))
+        return await self._download_image(image_url)
+    
+    async def _race_ipfs_image(self, ipfs_path: str) -> Optional[bytes]:
+        """
+        Download an IPFS image from whichever gateway delivers it first.
+        
+        The best-ranked gateway starts first; the others are hedged in
+        IPFS_IMAGE_HEDGE_DELAY apart. The losers are cancelled, as is
+        everything still running after IPFS_IMAGE_RACE_TIMEOUT.
+        
+        Args:
+            ipfs_path: CID and optional path (the part after /ipfs/)
+            
+        Returns:
+            Image bytes, or None if every gateway failed
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + IPFS_IMAGE_RACE_TIMEOUT
+        
+        async def download_after(gateway: str, delay: float) -> Optional[bytes]:
+            if delay:
+                await asyncio.sleep(delay)
+            start = loop.time()
+            stats = self._gateway_stats.setdefault(gateway, deque(maxlen=IPFS_GATEWAY_STATS_WINDOW))
+            try:
+                image_data = await self._download_image(f"{gateway}{ipfs_path}")
+            except asyncio.CancelledError:
+                # Losing the race isn't a failure, but running out the clock is
+                if loop.time() >= deadline:
+                    stats.append((loop.time() - start, False))
+                raise
+            stats.append((loop.time() - start, image_data is not None))
+            return image_data
+        
+        pending = {
+            asyncio.create_task(download_after(gateway, rank * IPFS_IMAGE_HEDGE_DELAY))
+            for rank, gateway in enumerate(self._ranked_ipfs_gateways())
+        }
+        try:
+            while pending:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    logger.warning(f"Timeout downloading IPFS image {ipfs_path[:60]}... from any gateway")
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    image_data = task.result()
+                    if image_data:
+                        return image_data
+        finally:
+            for task in pending:
+                task.cancel()
+        return None
+    
+    async def _download_image(self, image_url: str) -> Optional[bytes]:
+        """
+        Download image from a single URL.
+        
         Args:
             image_url: Image URL to download
             
         Returns:
             Image bytes, or None if download fails
         """
+        # Video file URLs would only be discarded after downloading them
+        if _VIDEO_EXT_RE.search(image_url):
+            logger.warning(f"URL points to a video file ({image_url[:60]}...), skipping")
+            return None
+        
         try:
             session = await self._get_session()
-            # Add comprehensive headers to avoid blocking
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Referer': 'https://alchemy.com/',
-            }
+            headers = IMAGE_HEADERS
             
             # For Cloudinary URLs, add specific headers and handle redirects
             if 'cloudinary.com' in image_url:
                 logger.info(f"📥 Downloading from Cloudinary: {image_url[:100]}...")
-                # Cloudinary URLs may need specific headers
-                headers['Referer'] = 'https://alchemy.com/'
-                headers['Origin'] = 'https://alchemy.com/'
+                headers = CLOUDINARY_IMAGE_HEADERS
+            
+            # Revalidate a previously downloaded copy instead of fetching it again (relists reuse images)
+            cached = self._image_cache.get(image_url)
+            if cached:
+                self._image_cache.move_to_end(image_url)
+                headers = {**headers, 'If-None-Match': cached[0]}
             
             async with session.get(
                 image_url,
                 headers=headers,
-                timeout=aiohttp.ClientTimeout(total=20),  # Longer timeout for Cloudinary
+                timeout=IMAGE_DOWNLOAD_TIMEOUT,
                 allow_redirects=True
             ) as response:
                 if response.status == 200:
                     content_type = response.headers.get('Content-Type', '')
-                    # For video files, try to read only first few MB to check size
-                    # Read in chunks to avoid loading huge files into memory
-                    image_data = b''
-                    max_size = 8 * 1024 * 1024  # 8MB limit
-                    chunk_size = 1024 * 1024  # 1MB chunks
-                    
-                    async for chunk in response.content.iter_chunked(chunk_size):
-                        image_data += chunk
-                        if len(image_data) > max_size:
-                            logger.warning(f"Image too large ({len(image_data)} bytes), stopping download")
-                            return None
-                    
-                    # Check if it's actually a video file (we don't want videos)
+                    # Check if it's actually a video file (we don't want videos) before reading the body
                     if 'video' in content_type.lower():
                         logger.warning(f"⚠️ URL returned video content (Content-Type: {content_type}), skipping")
                         return None
                     
+                    # Read in chunks to avoid loading huge files into memory
+                    if response.content_length and response.content_length > MAX_IMAGE_DOWNLOAD_BYTES:
+                        logger.warning(f"Image too large ({response.content_length} bytes), skipping download")
+                        return None
+                    
+                    if response.content_length and response.content_length <= IMAGE_SINGLE_READ_BYTES:
+                        # Typical NFT thumbnail - no need for chunked iteration
+                        image_data = await response.read()
+                    else:
+                        # Accumulate into a bytearray so each chunk is appended in place rather than copied
+                        buf = bytearray()
+                        async for chunk in response.content.iter_chunked(IMAGE_DOWNLOAD_CHUNK_SIZE):
+                            if not buf and chunk.startswith(_VIDEO_MAGIC_BYTES):
+                                logger.warning(f"URL returned video content (Content-Type: {content_type}, URL: {image_url[:60]}...), skipping")
+                                return None
+                            buf.extend(chunk)
+                            if len(buf) > MAX_IMAGE_DOWNLOAD_BYTES:
+                                logger.warning(f"Image too large ({len(buf)} bytes), stopping download")
+                                return None
+                        image_data = bytes(buf)
+                    
                     # Basic validation - check if it looks like image data
                     if len(image_data) < 100:
                         logger.warning(f"Image data too small ({len(image_data)} bytes), might not be valid")
                         return None
                     
-                    # Check if it's actually a video file by content type, magic bytes, or URL
-                    is_video_file = False
-                    if 'video' in content_type.lower():
-                        is_video_file = True
-                    elif image_data.startswith(b'\x00\x00\x00\x18ftyp') or image_data.startswith(b'\x1a\x45\xdf\xa3'):
-                        # MP4 or WebM magic bytes
-                        is_video_file = True
-                    elif any(ext in image_url.lower() for ext in ['.mp4', '.webm', '.mov', '.avi', '.mkv']):
-                        is_video_file = True
-                    
-                    if is_video_file:
+                    # Check if it's actually a video file by magic bytes
+                    # (video Content-Type and file extensions were already rejected above)
+                    if image_data.startswith(_VIDEO_MAGIC_BYTES):
                         logger.warning(f"URL returned video content (Content-Type: {content_type}, URL: {image_url[:60]}...), skipping")
                         return None
                     
                     logger.info(f"Downloaded image: {len(image_data)} bytes, Content-Type: {content_type} from {image_url[:60]}...")
+                    etag = response.headers.get('ETag')
+                    if etag:
+                        self._cache_image(image_url, etag, image_data)
                     return image_data
+                elif response.status == 304 and cached:
+                    logger.info(f"Image not modified, using cached copy ({len(cached[1])} bytes) for {image_url[:60]}...")
+                    return cached[1]
                 elif response.status == 400:
                     # For Cloudinary 400 errors, skip this URL - it's likely malformed
                     # Cloudinary URLs often fail with 400, so we'll try other URLs
@@ -1474,75 +2146,44 @@ class SalesFetcher:
         Returns:
             PNG image bytes, or None if extraction fails
         """
-        temp_video_path: Optional[str] = None
-        temp_image_path: Optional[str] = None
+        # Fail fast before downloading if frame extraction is unavailable
+        if importlib.util.find_spec("imageio") is None:
+            logger.error("imageio not installed - cannot extract video frames. Install with: pip install imageio imageio-ffmpeg")
+            return None
         
         try:
-            import imageio
-            import tempfile
-            
             logger.info(f"🎬 Extracting frame from video: {video_url[:80]}...")
             
-            # Download video to temporary file
+            # Download video into memory
             session = await self._get_session()
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            }
-            
             async with session.get(
                 video_url,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=30)  # Videos can be large
+                headers=VIDEO_HEADERS,
+                timeout=VIDEO_DOWNLOAD_TIMEOUT
             ) as response:
                 if response.status != 200:
                     logger.warning(f"Failed to download video: HTTP {response.status}")
                     return None
                 
+                # Limit video size to 50MB to avoid memory issues (check the declared size before reading)
+                if response.content_length and response.content_length > MAX_VIDEO_DOWNLOAD_BYTES:
+                    logger.warning(f"Video too large ({response.content_length} bytes), skipping frame extraction")
+                    return None
+                
                 video_data = await response.read()
-                # Limit video size to 50MB to avoid memory issues
-                if len(video_data) > 50 * 1024 * 1024:
+                if len(video_data) > MAX_VIDEO_DOWNLOAD_BYTES:
                     logger.warning(f"Video too large ({len(video_data)} bytes), skipping frame extraction")
                     return None
-                
-                # Write video to temp file
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.mp4') as temp_video:
-                    temp_video.write(video_data)
-                    temp_video_path = temp_video.name
-            
-            # Extract first frame using imageio
-            reader = imageio.get_reader(temp_video_path)
-            frame = reader.get_data(0)  # Get first frame
-            reader.close()
             
-            # Convert frame to PNG bytes
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as temp_image:
-                temp_image_path = temp_image.name
-                imageio.imwrite(temp_image_path, frame, format='PNG')
-            
-            with open(temp_image_path, 'rb') as f:
-                image_bytes = f.read()
+            # Decode off the event loop so other sales keep processing while ffmpeg runs
+            image_bytes = await asyncio.to_thread(_extract_first_frame, video_data)
             
             logger.info(f"✅ Successfully extracted frame: {len(image_bytes)} bytes")
             return image_bytes
                         
-        except ImportError:
-            logger.error("imageio not installed - cannot extract video frames. Install with: pip install imageio imageio-ffmpeg")
-            return None
         except Exception as e:
-            logger.error(f"Error in extract_video_frame: {e}", exc_info=True)
+            logger.error(f"Error in extract_video_frame: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
-        finally:
-            # Clean up temp files
-            if temp_video_path:
-                try:
-                    os.unlink(temp_video_path)
-                except OSError:
-                    pass
-            if temp_image_path:
-                try:
-                    os.unlink(temp_image_path)
-                except OSError:
-                    pass
     
     async def fetch_last_n_sales(self, n: int = 1) -> List[SaleEvent]:
         """
@@ -1554,6 +2195,9 @@ class SalesFetcher:
         Returns:
             List of SaleEvent objects
         """
+        if n <= 0:
+            return []
+        
         try:
             # Get current block
             current_block = await self.get_current_block()
@@ -1561,62 +2205,50 @@ class SalesFetcher:
                 logger.error("Failed to get current block")
                 return []
             
-            # Strategy: Start from recent blocks and work backwards
-            # Fetch transfers in smaller chunks, starting from most recent
+            # Strategy: one query over the whole window, newest first, then process the
+            # transfers in batches so the most recent sales are priced before older ones
             sales = []
-            block_chunk_size = 3000  # Smaller chunks for faster processing
+            seen_hashes = set()  # Lowercased tx hashes already turned into sales
+            min_block_seen = None  # Oldest block among collected sales
+            block_chunk_size = 3000  # Blocks per chunk of the search window
             max_chunks = 3  # Check up to 3 chunks (9k blocks = ~1 day)
+            max_transfers_per_chunk = 100  # Transfers priced per batch, to avoid timeouts
+            
+            from_block = max(0, current_block - (max_chunks * block_chunk_size))
+            logger.info("Checking blocks %d to %d", from_block, current_block)
+            
+            # Alchemy returns at most max_count transfers; in descending order those are the most
+            # recent ones, so any further pages only hold older transfers we'd never process
+            transfers_data = await self.get_asset_transfers(
+                contract_address=self.contract_address,
+                category=["erc721", "erc1155"],
+                from_block=hex(from_block),
+                to_block=hex(current_block),
+                order="desc",
+                max_count=max_chunks * max_transfers_per_chunk
+            )
+            
+            all_transfers = transfers_data.get("transfers", [])
+            logger.info("Found %d transfers in blocks %d-%d", len(all_transfers), from_block, current_block)
+            
+            # Parse each block number once, then sort by it, most recent first, before processing
+            all_transfers = sorted(
+                ((_hex_int(transfer.get("blockNum")), transfer) for transfer in all_transfers),
+                key=operator.itemgetter(0),
+                reverse=True
+            )
             
-            # Start from current block and work backwards
             for chunk in range(max_chunks):
-                to_block = current_block - (chunk * block_chunk_size)
-                from_block = max(0, to_block - block_chunk_size)
-                
-                if from_block >= to_block:
-                    break
-                
-                logger.info(f"Checking blocks {from_block} to {to_block} (chunk {chunk + 1}/{max_chunks})")
-                
-                # Get transfers for this chunk
-                transfers_data = await self.get_asset_transfers(
-                    contract_address=self.contract_address,
-                    category=["erc721", "erc1155"],
-                    from_block=hex(from_block),
-                    to_block=hex(to_block)
-                )
-                
-                transfers = transfers_data.get("transfers", [])
-                logger.info(f"Found {len(transfers)} transfers in blocks {from_block}-{to_block}")
+                transfers = all_transfers[chunk * max_transfers_per_chunk:(chunk + 1) * max_transfers_per_chunk]
                 if not transfers:
-                    continue
-                
-                # Sort transfers by block number (most recent first) before processing
-                # Extract block numbers for sorting
-                transfers_with_blocks = []
-                for transfer in transfers:
-                    block_hex = transfer.get("blockNum", "0x0")
-                    block_num = 0
-                    if block_hex and block_hex != "0x0":
-                        try:
-                            block_num = int(block_hex, 16)
-                        except (ValueError, TypeError):
-                            pass
-                    transfers_with_blocks.append((block_num, transfer))
-                
-                # Sort by block number descending (most recent first)
-                transfers_with_blocks.sort(key=lambda x: x[0], reverse=True)
-                transfers = [t[1] for t in transfers_with_blocks]
+                    break
                 
-                # Process ALL transfers in this chunk (don't limit - we need the most recent)
-                # But limit to reasonable number to avoid timeout
-                max_transfers_per_chunk = 100
-                if len(transfers) > max_transfers_per_chunk:
-                    logger.info(f"Limiting to first {max_transfers_per_chunk} most recent transfers from {len(transfers)} total")
-                    transfers = transfers[:max_transfers_per_chunk]
+                logger.info("Processing %d transfers (batch %d/%d)", len(transfers), chunk + 1, max_chunks)
                 
                 # Process transfers - collect all first, then check prices in batch
                 transfer_candidates = []
-                for transfer in transfers:
+                candidate_hashes = set()
+                for block_number, transfer in transfers:
                     from_addr = transfer.get("from", "").lower()
                     to_addr = transfer.get("to", "").lower()
                     
@@ -1628,40 +2260,27 @@ class SalesFetcher:
                     if not tx_hash:
                         continue
                     
-                    # Get block number for sorting
-                    block_num_hex = transfer.get("blockNum", "0x0")
-                    block_number = 0
-                    if block_num_hex and block_num_hex != "0x0":
-                        try:
-                            block_number = int(block_num_hex, 16)
-                        except (ValueError, TypeError):
-                            pass
+                    # Price each transaction once - multi-item sales have one transfer per token,
+                    # and a transaction may already be a sale from an earlier batch
+                    tx_hash_key = tx_hash.lower()
+                    if tx_hash_key in seen_hashes or tx_hash_key in candidate_hashes:
+                        continue
+                    candidate_hashes.add(tx_hash_key)
                     
-                    # Get transaction index for better sorting (within same block)
-                    tx_index_hex = transfer.get("transactionIndex", "0x0")
-                    tx_index = 0
-                    if tx_index_hex and tx_index_hex != "0x0":
-                        try:
-                            tx_index = int(tx_index_hex, 16)
-                        except (ValueError, TypeError):
-                            pass
+                    # Transaction index orders sales within a block
+                    tx_index = _hex_int(transfer.get("transactionIndex"))
                     
                     token_id_raw = transfer.get("tokenId", "")
                     
                     # Convert token ID from hex to decimal string if needed
-                    if token_id_raw:
-                        if isinstance(token_id_raw, str) and token_id_raw.startswith("0x"):
-                            try:
-                                token_id = str(int(token_id_raw, 16))
-                            except (ValueError, TypeError):
-                                token_id = token_id_raw
-                        else:
-                            token_id = str(token_id_raw)
+                    if isinstance(token_id_raw, str) and token_id_raw.startswith("0x"):
+                        token_id = str(_hex_int(token_id_raw))
                     else:
-                        token_id = ""
+                        token_id = str(token_id_raw) if token_id_raw else ""
                     
                     transfer_candidates.append({
                         "tx_hash": tx_hash,
+                        "tx_hash_key": tx_hash_key,  # Canonical form for duplicate checks
                         "from_addr": from_addr,
                         "to_addr": to_addr,
                         "token_id": token_id,
@@ -1669,97 +2288,99 @@ class SalesFetcher:
                         "transaction_index": tx_index
                     })
                 
-                # Check prices for all candidates in parallel (batch)
-                if transfer_candidates:
-                    price_tasks = [
-                        self._get_transaction_price_simple(candidate["tx_hash"], candidate["from_addr"], candidate["to_addr"])
-                        for candidate in transfer_candidates
+                # Once we have n sales, nothing from an older block than all of them can make the
+                # cut - drop those candidates before paying for their price checks
+                if len(sales) >= n:
+                    transfer_candidates = [
+                        candidate for candidate in transfer_candidates
+                        if candidate["block_number"] >= min_block_seen
                     ]
-                    price_results = await asyncio.gather(*price_tasks, return_exceptions=True)
+                
+                # Check prices for all candidates in parallel (batch), bounded so each check's
+                # sequential RPC calls aren't interleaved with every other candidate's
+                if transfer_candidates:
+                    # One batched request for every candidate's transaction; the price checks then hit the cache
+                    await self.prefetch_transactions([candidate["tx_hash"] for candidate in transfer_candidates])
+                    semaphore = asyncio.Semaphore(MAX_CONCURRENT_PRICE_CHECKS)
+                    
+                    async def bounded_price(candidate: dict) -> Optional[Tuple[int, bool]]:
+                        try:
+                            async with semaphore:
+                                return await self._get_transaction_price_simple(
+                                    candidate["tx_hash"], candidate["from_addr"], candidate["to_addr"]
+                                )
+                        except Exception as e:
+                            logger.debug("Price check failed for %.10s...: %s", candidate["tx_hash"], e)
+                            return None
+                    
+                    price_results = await asyncio.gather(*(bounded_price(candidate) for candidate in transfer_candidates))
                     
                     # Create sales only for transfers with prices
                     for candidate, price_result in zip(transfer_candidates, price_results):
-                        if isinstance(price_result, Exception):
-                            logger.debug(f"Price check failed for {candidate['tx_hash'][:10]}...: {price_result}")
+                        if price_result is None:
                             continue
                         
+                        # Lazy %-style logging - runs per transfer, so skip formatting when the level is off
                         price, is_weth = price_result
                         if price > 0:
-                            logger.debug(f"Transfer {candidate['tx_hash'][:10]}... - Price: {price} wei ({'WETH' if is_weth else 'ETH'})")
+                            logger.debug("Transfer %.10s... - Price: %d wei (%s)", candidate["tx_hash"], price, "WETH" if is_weth else "ETH")
                         
                         if price == 0:
                             # Log this at INFO level so we can see if WETH sales are being filtered out
-                            logger.info(f"⚠️ Skipping transfer {candidate['tx_hash'][:10]}... - no price detected (might be WETH sale that failed detection)")
-                            logger.info(f"⚠️   Seller: {candidate['from_addr'][:10] if candidate.get('from_addr') else 'None'}..., Buyer: {candidate['to_addr'][:10] if candidate.get('to_addr') else 'None'}...")
+                            logger.info(
+                                "⚠️ Skipping transfer %.10s... - no price detected (might be WETH sale that failed detection). Seller: %.10s..., Buyer: %.10s...",
+                                candidate["tx_hash"], candidate["from_addr"] or "None", candidate["to_addr"] or "None"
+                            )
                             continue
                         
+                        seen_hashes.add(candidate["tx_hash_key"])
+                        
+                        # Positional: tx_hash, buyer, seller, token_id, token_ids, token_count, total_price, timestamp, is_weth
+                        token_id = candidate["token_id"]
                         sale = SaleEvent(
-                            tx_hash=candidate["tx_hash"],
-                            buyer=candidate["to_addr"],
-                            seller=candidate["from_addr"],
-                            token_id=candidate["token_id"],
-                            token_ids=[candidate["token_id"]],
-                            token_count=1,
-                            total_price=price,
-                            timestamp=None,
-                            is_weth=is_weth
+                            candidate["tx_hash"], candidate["to_addr"], candidate["from_addr"],
+                            token_id, (token_id,), 1, price, None, is_weth
                         )
                         
                         # Store block number with sale for sorting
                         sale._block_number = candidate["block_number"]
                         # Also store transaction index for better sorting (WETH sales might be in same block)
                         sale._tx_index = candidate.get("transaction_index", 0)
+                        # Precomputed sort key (most recent = largest)
+                        sale._sort_key = (sale._block_number, sale._tx_index)
                         sales.append(sale)
+                        if min_block_seen is None or sale._block_number < min_block_seen:
+                            min_block_seen = sale._block_number
                 
-                # After processing this chunk, sort and check
-                # Sort by block number first, then by transaction index (most recent first)
-                if sales:
-                    sales.sort(key=lambda x: (getattr(x, '_block_number', 0), getattr(x, '_tx_index', 0)), reverse=True)
-                    
-                    # Remove duplicates
-                    seen_hashes = set()
-                    unique_sales = []
-                    for sale in sales:
-                        if sale.tx_hash.lower() not in seen_hashes:
-                            seen_hashes.add(sale.tx_hash.lower())
-                            unique_sales.append(sale)
-                    sales = unique_sales
-                    
-                    # If we have sales from the most recent chunk, check if block is very recent
-                    # If we're in chunk 0 (most recent) and have sales, return the top one
-                    if chunk == 0 and len(sales) >= n:
-                        logger.info(f"Found {len(sales)} sales in most recent chunk. Most recent block: {sales[0]._block_number}, Token: {sales[0].token_id}")
-                        return sales[:n]
-                    
-                    # If we have enough sales total, return
-                    if len(sales) >= n:
-                        logger.info(f"Found {len(sales)} sales across chunks. Most recent block: {sales[0]._block_number}, Token: {sales[0].token_id}")
-                        return sales[:n]
-            
-            # Final sort and deduplication (in case we collected from multiple chunks)
-            # Sort by block number first, then by transaction index (most recent first)
-            sales.sort(key=lambda x: (getattr(x, '_block_number', 0), getattr(x, '_tx_index', 0)), reverse=True)
-            
-            # Remove duplicates by transaction hash
-            seen_hashes = set()
-            unique_sales = []
-            for sale in sales:
-                if sale.tx_hash.lower() not in seen_hashes:
-                    seen_hashes.add(sale.tx_hash.lower())
-                    unique_sales.append(sale)
-            
-            if unique_sales:
-                price_eth = unique_sales[0].total_price / (10**18)
-                currency = "WETH" if unique_sales[0].is_weth else "ETH"
-                logger.info(f"Found {len(unique_sales)} unique sales. Most recent block: {unique_sales[0]._block_number}, TX: {unique_sales[0].tx_hash[:16]}...")
-                logger.info(f"Most recent sale: {price_eth:.6f} {currency} for token {unique_sales[0].token_id}")
+                # If we have enough sales, stop once later batches can only hold older transfers
+                # (a block can straddle two batches, so its remaining transfers must be checked too)
+                if len(sales) >= n:
+                    next_batch_start = (chunk + 1) * max_transfers_per_chunk
+                    if next_batch_start >= len(all_transfers) or min_block_seen > all_transfers[next_batch_start][0]:
+                        logger.info("Found %d sales in %d batch(es)", len(sales), chunk + 1)
+                        break
+            
+            # Only the n most recent are returned, so select them instead of sorting everything:
+            # by block number first, then by transaction index (most recent first)
+            top_sales = heapq.nlargest(n, sales, key=operator.attrgetter('_sort_key'))
+            
+            if top_sales:
+                if logger.isEnabledFor(logging.INFO):
+                    latest = top_sales[0]
+                    logger.info("Found %d unique sales. Most recent block: %d, TX: %.16s...", len(sales), latest._block_number, latest.tx_hash)
+                    logger.info("Most recent sale: %.6f %s for token %s", latest.total_price / (10**18), "WETH" if latest.is_weth else "ETH", latest.token_id)
             else:
                 logger.warning("No sales found in the specified block range")
-                logger.warning(f"Searched blocks from {current_block - (max_chunks * block_chunk_size)} to {current_block}")
+                logger.warning("Searched blocks from %d to %d", from_block, current_block)
             
-            return unique_sales[:n]
+            return top_sales
             
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            # Transient network failure - nothing to debug locally
+            logger.error(f"Network error fetching last sales: {e}")
+            return []
         except Exception as e:
-            logger.error(f"Error fetching last sales: {e}")
+            # RPC errors are handled in _rpc_call, so anything reaching here is unexpected
+            logger.error(f"Error fetching last sales: {e}", exc_info=True)
             return []
 